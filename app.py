@@ -7,14 +7,29 @@ DAY 20: 멀티 페이지 구조로 전환 (4개 페이지)
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+import io
+import codecs
+import re
+import sys
+import functools
+import hashlib
+import uuid
+import logging
+import threading
 import yaml
+from datetime import date
 from pathlib import Path
 import os
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
 # 유틸리티 모듈
 from utils.session_manager import SessionManager
 from utils.environment import Environment
+from utils.dtypes import downcast, downcast_numeric
+from utils.url_parser import extract_place_id
 
 # 모듈
 from modules.data_loader import DataLoader
@@ -24,10 +39,18 @@ from modules.text_analyzer import TextAnalyzer
 from modules.visualizer import Visualizer
 from modules.report_generator import HTMLReportGenerator
 from modules.insight_generator import InsightGenerator
+from modules.sales_analyzer import SalesAnalyzer
+from modules.gpt_analyzer import GPTAnalyzer
+from utils.api_key_manager import APIKeyManager, get_api_key
+
+logger = logging.getLogger(__name__)
 
 # 환경변수 로드
 load_dotenv()
 
+# 크롤링 URL에서 영화 ID 추출용 정규식 (모듈 로드 시 한 번만 컴파일)
+_MOVIE_ID_RE = re.compile(r'code=(\d+)')
+
 # 페이지 설정
 st.set_page_config(
     page_title="Auto-Insight Platform",
@@ -37,9 +60,9 @@ st.set_page_config(
 )
 
 # ==================== CSS 스타일 ====================
-def load_custom_css():
-    """커스텀 CSS 로드"""
-    st.markdown("""
+# 리터럴 상수이므로 재실행 시 문자열 생성 비용 없음.
+# Streamlit은 재실행마다 화면 요소를 다시 그리므로 st.markdown 호출 자체는 매번 필요
+_CUSTOM_CSS = """
     <style>
         /* 메인 배경 - 다크 */
         .main {
@@ -118,7 +141,289 @@ def load_custom_css():
             color: white;
         }
     </style>
-    """, unsafe_allow_html=True)
+"""
+
+
+def load_custom_css():
+    """커스텀 CSS 로드"""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+
+# ==================== 캐시 헬퍼 ====================
+
+# 인코딩 판별에 사용할 앞부분 크기 (전체 파일을 디코딩하지 않음)
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+
+def _detect_encoding(raw: bytes) -> str:
+    """앞부분이 UTF-8로 디코딩되지 않으면 CP949로 간주 (디코딩 검사는 파싱보다 훨씬 빠름)"""
+    # 잘린 끝의 멀티바이트 문자는 오류로 보지 않도록 final=False로 디코딩
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        decoder.decode(raw[:_ENCODING_SAMPLE_BYTES], final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def _has_undecoded_bytes(df: pd.DataFrame) -> bool:
+    """PyArrow는 UTF-8이 아닌 값이 섞인 컬럼을 bytes로 읽으므로 컬럼별 첫 값만 확인"""
+    for col in df.select_dtypes(include='object').columns:
+        idx = df[col].first_valid_index()
+        if idx is not None and isinstance(df[col].loc[idx], bytes):
+            return True
+    return False
+
+
+def _read_csv(buffer: io.BytesIO) -> pd.DataFrame:
+    """CSV 파일: 인코딩을 먼저 판별해 한 번만 파싱 (PyArrow 멀티스레드 파서 우선)"""
+    encoding = _detect_encoding(buffer.getvalue())
+    try:
+        df = pd.read_csv(buffer, encoding=encoding, engine='pyarrow')
+        # 앞부분만 UTF-8이고 뒤쪽에 CP949 바이트가 있으면 CP949로 다시 파싱
+        if encoding == 'cp949' or not _has_undecoded_bytes(df):
+            return df
+        encoding = 'cp949'
+    except (ValueError, ImportError):
+        pass
+    buffer.seek(0)
+    try:
+        return pd.read_csv(buffer, encoding=encoding, low_memory=False)
+    except UnicodeDecodeError:
+        if encoding == 'cp949':
+            raise
+        buffer.seek(0)
+        return pd.read_csv(buffer, encoding='cp949', low_memory=False)
+
+
+def _read_excel(buffer: io.BytesIO) -> pd.DataFrame:
+    """Excel 파일: Rust 기반 calamine 엔진 우선, 미설치(또는 pandas<2.2) 시 openpyxl"""
+    try:
+        return pd.read_excel(buffer, engine='calamine')
+    except (ValueError, ImportError):
+        buffer.seek(0)
+        return pd.read_excel(buffer)
+
+
+# 확장자별 업로드 파일 리더 (새 형식은 여기에만 추가)
+_UPLOAD_READERS = {
+    '.csv': _read_csv,
+    '.xlsx': _read_excel,
+    '.xls': _read_excel,
+    '.parquet': pd.read_parquet,
+    '.feather': pd.read_feather,
+}
+
+
+@st.cache_data(show_spinner=False)
+def _parse_uploaded(file_bytes: bytes, name: str) -> pd.DataFrame:
+    """
+    업로드 파일 파싱 (파일 내용 기준 캐싱)
+
+    Streamlit은 위젯이 바뀔 때마다 스크립트를 재실행하므로,
+    같은 파일은 캐시된 DataFrame을 그대로 반환한다.
+    """
+    ext = Path(name).suffix.lower()
+    reader = _UPLOAD_READERS.get(ext)
+    if reader is None:
+        raise ValueError(f"지원하지 않는 파일 형식: {ext}")
+
+    df = reader(io.BytesIO(file_bytes))
+
+    # 세션에 오래 남는 데이터이므로 dtype 다운캐스팅
+    return downcast(df)
+
+
+def _df_content_hash(df: pd.DataFrame):
+    """
+    DataFrame 전체 내용 해시 (프로세스 공용 캐시 키, 컬럼명·행 순서·인덱스까지 반영)
+
+    일부 행만 보거나 행 해시를 합산하면 다른 데이터/정렬에도 같은 키가 나와
+    다른 DataFrame의 캐시 결과를 돌려줄 수 있으므로 항상 전체를 순서대로 해시한다.
+
+    Returns:
+        해시 문자열, 리스트 등 해시 불가능한 값이 있으면 None (호출 측은 캐시 없이 계산)
+    """
+    try:
+        row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+    except TypeError:
+        return None
+    digest = hashlib.sha1(repr(tuple(map(str, df.columns))).encode('utf-8'))
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def _write_csv(df: pd.DataFrame) -> bytes:
+    """
+    DataFrame → CSV 바이트 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)
+
+    전체 CSV 문자열을 만든 뒤 다시 인코딩하지 않고 버퍼에 청크 단위로 바로 기록
+    """
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8-sig', chunksize=50_000)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _csv_bytes(content_hash: str, _df: pd.DataFrame) -> bytes:
+    """
+    다운로드용 CSV (전체 내용 해시 기준 캐싱)
+
+    필터/검색 위젯 조작마다 재실행되어도 내용이 같으면 CSV를 다시 만들지 않는다.
+    """
+    return _write_csv(_df)
+
+
+def to_csv_download(df: pd.DataFrame) -> bytes:
+    """DataFrame → 다운로드용 CSV 바이트 (캐시 사용)"""
+    content_hash = _df_content_hash(df)
+    if content_hash is None:
+        return _write_csv(df)
+    return _csv_bytes(content_hash, df)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _filtered_csv(analysis_token: str, filter_key: tuple, _df: pd.DataFrame) -> bytes:
+    """
+    필터링 결과 다운로드용 CSV (분석 식별자 + 필터 조건 기준 캐싱)
+
+    필터 조건마다 CSV 전체가 세션에 남지 않도록 프로세스 캐시에 최근 몇 개만 보관한다.
+    """
+    return _write_csv(_df)
+
+
+def _analysis_token(results: dict) -> str:
+    """분석 결과 식별자 (분석을 다시 실행하면 새 결과 딕셔너리이므로 새 식별자)"""
+    return results.setdefault('analysis_token', uuid.uuid4().hex)
+
+
+def _write_parquet(df: pd.DataFrame):
+    """
+    DataFrame → Parquet 바이트 (zstd 압축)
+
+    숫자를 문자열로 포맷하지 않고 컬럼 버퍼를 그대로 기록하므로 CSV보다 빠르고 작다.
+    Arrow로 변환할 수 없는 컬럼(혼합 타입 등)이 있으면 None 반환.
+    """
+    buffer = io.BytesIO()
+    try:
+        df.to_parquet(buffer, index=False, compression='zstd')
+    except (ValueError, TypeError, NotImplementedError, ImportError) as e:
+        logger.warning(f"Parquet 변환 실패: {e}")
+        return None
+    return buffer.getvalue()
+
+
+def _export_file(results: dict, name: str, get_df, fmt: str = 'csv'):
+    """
+    내보내기용 파일 바이트 (fmt: 'csv' 또는 'parquet')
+
+    분석 결과 DataFrame은 바뀌지 않으므로 결과 딕셔너리에 한 번만 만들어 두고
+    재실행마다 전체 내용 해시도 다시 계산하지 않는다.
+    """
+    exports = results.setdefault('exports', {})
+    if (name, fmt) not in exports:
+        df = get_df()
+        exports[(name, fmt)] = to_csv_download(df) if fmt == 'csv' else _write_parquet(df)
+    return exports[(name, fmt)]
+
+
+def _parquet_download_button(results: dict, name: str, get_df, label: str, file_name: str):
+    """Parquet 다운로드 버튼 (변환할 수 없는 데이터면 표시하지 않음)"""
+    data = _export_file(results, name, get_df, fmt='parquet')
+    if data is not None:
+        st.download_button(
+            label=label,
+            data=data,
+            file_name=file_name,
+            mime="application/octet-stream",
+            use_container_width=True
+        )
+
+
+@st.cache_data(show_spinner=False)
+def _quality_report(content_hash: str, _df: pd.DataFrame) -> dict:
+    """
+    데이터 품질 리포트 (전체 내용 해시 기준 캐싱)
+
+    _df는 밑줄 접두사로 Streamlit 해싱에서 제외되므로
+    리포트 펼치기/접기 등 재실행 시 전체 스캔을 반복하지 않는다.
+    """
+    return DataLoader.get_data_quality_report(_df)
+
+
+@st.cache_resource(show_spinner=False)
+def _load_sample(sample_path: str, mtime: float) -> pd.DataFrame:
+    """
+    샘플 파일 로드 (경로 + 수정 시각 기준 캐싱)
+
+    샘플 파일은 바뀌지 않고 분석 모듈은 입력을 복사해서 쓰므로,
+    cache_data의 반환 시 복사 없이 프로세스 전체에서 같은 DataFrame을 공유한다.
+    """
+    return downcast(DataLoader.load_file(sample_path))
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def _sample_files() -> list:
+    """샘플 데이터 파일 목록 (재실행마다 폴더를 다시 스캔하지 않도록 60초 캐싱)"""
+    return Environment.list_sample_data()
+
+
+_CRAWLER_DIR = Path(__file__).parent / 'crawlers'
+
+
+def _add_crawler_path():
+    """crawlers/ 폴더를 import 경로에 추가"""
+    if str(_CRAWLER_DIR) not in sys.path:
+        sys.path.insert(0, str(_CRAWLER_DIR))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_movie_crawler_cls():
+    """NaverMovieCrawler 클래스 (import는 프로세스당 한 번만 수행)"""
+    _add_crawler_path()
+    from naver_movie_crawler import NaverMovieCrawler
+    return NaverMovieCrawler
+
+
+@functools.lru_cache(maxsize=1)
+def _get_place_crawler_cls():
+    """NaverPlaceCrawler 클래스 (import는 프로세스당 한 번만 수행)"""
+    _add_crawler_path()
+    from naver_place_crawler import NaverPlaceCrawler
+    return NaverPlaceCrawler
+
+
+# 캐싱된 크롤러(브라우저, 수집 결과 상태)는 모든 세션이 공유하므로 크롤링 전체를 잠금으로 직렬화
+_MOVIE_CRAWL_LOCK = threading.Lock()
+_PLACE_CRAWL_LOCK = threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def get_movie_crawler():
+    """네이버 영화 크롤러 (브라우저는 필요할 때 한 번만 띄워 재사용하도록 리소스 캐싱)"""
+    crawler = _get_movie_crawler_cls()(headless=True, delay=0.5)
+    atexit.register(crawler.close)
+    return crawler
+
+
+@st.cache_resource(show_spinner=False)
+def get_place_crawler():
+    """네이버 플레이스 크롤러 (Chrome 프로세스를 재사용하도록 리소스 캐싱)"""
+    crawler = _get_place_crawler_cls()(headless=True, delay=0.5)
+    atexit.register(crawler.close)
+    return crawler
+
+
+@st.cache_resource(show_spinner=False)
+def get_visualizer():
+    """시각화 모듈 (상태가 없으므로 세션 간 하나의 인스턴스 공유)"""
+    return Visualizer()
+
+
+@st.cache_resource(show_spinner=False)
+def get_report_generator():
+    """HTML 리포트 생성기 (상태가 없으므로 세션 간 하나의 인스턴스 공유)"""
+    return HTMLReportGenerator()
 
 
 # ==================== 페이지 함수들 ====================
@@ -148,30 +453,22 @@ def page_start():
         show_data_info()
 
 
+@st.fragment
 def render_file_upload():
     """파일 업로드 UI"""
-    st.markdown("#### 📁 CSV 또는 Excel 파일 업로드")
+    st.markdown("#### 📁 CSV · Excel · Parquet 파일 업로드")
 
     uploaded_file = st.file_uploader(
         "파일 선택",
-        type=['csv', 'xlsx', 'xls'],
+        type=[ext.lstrip('.') for ext in _UPLOAD_READERS],
         key="file_uploader"
     )
 
     if uploaded_file is not None:
         try:
             with st.spinner("📂 파일을 읽는 중..."):
-                # 파일 로드 (Streamlit UploadedFile 객체는 pandas로 직접 읽기)
-                if uploaded_file.name.endswith('.csv'):
-                    # CSV 파일: 인코딩 자동 감지
-                    try:
-                        df = pd.read_csv(uploaded_file, encoding='utf-8')
-                    except UnicodeDecodeError:
-                        uploaded_file.seek(0)  # 파일 포인터 리셋
-                        df = pd.read_csv(uploaded_file, encoding='cp949')
-                else:
-                    # Excel 파일
-                    df = pd.read_excel(uploaded_file)
+                # 파일 로드 (파일 내용 해시 기준 캐싱)
+                df = _parse_uploaded(uploaded_file.getvalue(), uploaded_file.name)
 
                 # 세션에 저장
                 SessionManager.save_data(
@@ -180,15 +477,23 @@ def render_file_upload():
                     file_name=uploaded_file.name
                 )
 
+                # fragment 재실행은 하단 데이터 정보(fragment 밖)를 갱신하지 않으므로
+                # 새 파일일 때만 전체 페이지를 한 번 다시 그림
+                if st.session_state.get(SessionManager.KEY_UPLOAD_FILE_ID) != uploaded_file.file_id:
+                    st.session_state[SessionManager.KEY_UPLOAD_FILE_ID] = uploaded_file.file_id
+                    st.rerun()
+
                 st.success(f"✅ 파일 업로드 성공: {uploaded_file.name}")
 
                 # 미리보기
                 st.markdown("##### 📋 데이터 미리보기 (상위 5행)")
-                st.dataframe(df.head(), use_container_width=True)
+                st.table(df.head())  # 5행 미리보기는 정적 테이블로 충분
 
                 # 데이터 품질 리포트
                 with st.expander("📊 데이터 품질 리포트"):
-                    quality_report = DataLoader.get_data_quality_report(df)
+                    content_hash = _df_content_hash(df)
+                    quality_report = (_quality_report(content_hash, df) if content_hash is not None
+                                      else DataLoader.get_data_quality_report(df))
 
                     col1, col2, col3, col4 = st.columns(4)
                     col1.metric("총 행 수", f"{quality_report['total_rows']:,}")
@@ -204,9 +509,10 @@ def render_file_upload():
         except Exception as e:
             st.error(f"❌ 파일 로드 실패: {str(e)}")
     else:
-        st.info("📤 CSV 또는 Excel 파일을 업로드하세요")
+        st.info("📤 CSV, Excel 또는 Parquet 파일을 업로드하세요")
 
 
+@st.fragment
 def render_crawling_ui():
     """크롤링 UI (환경별 분기)"""
     st.markdown("#### 🌐 웹 크롤링")
@@ -263,10 +569,8 @@ def render_movie_crawling():
 
         try:
             # URL에서 영화 ID 추출
-            import re
-
             if 'code=' in movie_url:
-                match = re.search(r'code=(\d+)', movie_url)
+                match = _MOVIE_ID_RE.search(movie_url)
                 movie_id = match.group(1) if match else None
             elif movie_url.isdigit():
                 movie_id = movie_url
@@ -283,12 +587,7 @@ def render_movie_crawling():
             with st.spinner(f"🤖 네이버 영화에서 {max_reviews}개 리뷰를 크롤링하는 중..."):
                 # 버그 #36 수정: 크롤러 import 실패 처리
                 try:
-                    import sys
-                    crawler_path = Path(__file__).parent / 'crawlers'
-                    if str(crawler_path) not in sys.path:
-                        sys.path.insert(0, str(crawler_path))
-
-                    from naver_movie_crawler import NaverMovieCrawler
+                    _get_movie_crawler_cls()
                 except ImportError as e:
                     st.error(f"❌ 크롤러 모듈을 찾을 수 없습니다: {str(e)}")
                     st.info("💡 crawlers/ 폴더와 naver_movie_crawler.py 파일을 확인하세요.")
@@ -298,42 +597,51 @@ def render_movie_crawling():
                     st.error(f"❌ 크롤러 로드 중 오류 발생: {str(e)}")
                     return
 
-                # 크롤링 실행
-                crawler = NaverMovieCrawler(headless=True, delay=0.5)
-
-                try:
-                    df = crawler.crawl_reviews(movie_id, max_reviews=max_reviews)
-
-                    if df is not None and len(df) > 0:
-                        # 컬럼명 매핑
-                        df_mapped = df.rename(columns={
-                            'review': 'text',
-                            'score': 'rating'
-                        })
-
-                        # 세션에 저장
-                        SessionManager.save_data(
-                            data=df_mapped,
-                            data_type='review',
-                            source='crawl_movie',
-                            file_name=f'movie_{movie_id}_reviews.csv'
-                        )
-
-                        st.success(f"✅ 크롤링 완료! {len(df)}개 리뷰 수집")
-                        st.balloons()
-                        # 버그 #35 수정: 세션 상태 저장 완료 대기
-                        import time
-                        time.sleep(0.1)
-                        st.rerun()
-                    else:
-                        st.error("❌ 리뷰를 수집하지 못했습니다")
+                # 크롤링 실행 (캐싱된 브라우저 재사용, 다른 세션과 동시에 쓰지 않도록 잠금)
+                with _MOVIE_CRAWL_LOCK:
+                    crawler = get_movie_crawler()
+                    try:
+                        # 정적 페이지는 HTTP 병렬 요청으로 수집, 실패 시 브라우저 크롤링으로 대체
+                        df = crawler.crawl_reviews_concurrent(movie_id, max_reviews=max_reviews)
+                        if df is None or len(df) == 0:
+                            df = crawler.crawl_reviews(movie_id, max_reviews=max_reviews)
+                    except Exception:
+                        # 브라우저가 비정상 상태일 수 있으므로 다음 요청에서 재생성
+                        crawler.close()
+                        get_movie_crawler.clear()
+                        raise
+
+                if df is not None and len(df) > 0:
+                    # 컬럼명 매핑 (크롤러가 새로 만든 DataFrame이므로 복사 없이 제자리 변경)
+                    df.rename(columns={
+                        'review': 'text',
+                        'score': 'rating'
+                    }, inplace=True)
+
+                    # 세션에 저장
+                    SessionManager.save_data(
+                        data=downcast(df),
+                        data_type='review',
+                        source='crawl_movie',
+                        file_name=f'movie_{movie_id}_reviews.csv'
+                    )
 
-                finally:
-                    crawler.close()
+                    if crawler.truncated:
+                        # 바로 재실행되므로 재실행 후에도 남는 토스트로 알림
+                        st.toast("일부 페이지 요청이 실패하여 수집이 중간에 멈췄습니다", icon="⚠️")
+                    st.success(f"✅ 크롤링 완료! {len(df)}개 리뷰 수집")
+                    st.balloons()
+                    # 세션 상태는 동기적으로 저장되므로 대기 없이 바로 재실행
+                    st.rerun()
+                else:
+                    st.error("❌ 리뷰를 수집하지 못했습니다")
 
         except Exception as e:
             st.error(f"❌ 크롤링 오류: {str(e)}")
-            st.exception(e)
+            logger.exception("크롤링 실패")
+            # 상세 traceback 화면 출력은 로컬 디버깅에서만
+            if Environment.is_local():
+                st.exception(e)
 
 
 def render_place_crawling():
@@ -366,25 +674,7 @@ def render_place_crawling():
 
         try:
             # URL에서 플레이스 ID 추출
-            import re
-
-            patterns = [
-                r'place\.naver\.com/[^/]+/(\d+)',
-                r'pcmap\.place\.naver\.com/[^/]+/(\d+)',
-                r'map\.naver\.com/[^/]+/place/(\d+)',
-                r'/place/(\d+)',
-                r'(\d{10,})',
-            ]
-
-            place_id = None
-            for pattern in patterns:
-                match = re.search(pattern, place_url)
-                if match:
-                    place_id = match.group(1)
-                    break
-
-            if not place_id and place_url.isdigit():
-                place_id = place_url
+            place_id = extract_place_id(place_url)
 
             if not place_id:
                 st.error("❌ 올바른 URL 또는 플레이스 ID를 입력하세요")
@@ -395,12 +685,7 @@ def render_place_crawling():
             with st.spinner(f"🤖 네이버 플레이스에서 {max_reviews}개 리뷰를 크롤링하는 중..."):
                 # 버그 #36 수정: 크롤러 import 실패 처리
                 try:
-                    import sys
-                    crawler_path = Path(__file__).parent / 'crawlers'
-                    if str(crawler_path) not in sys.path:
-                        sys.path.insert(0, str(crawler_path))
-
-                    from naver_place_crawler import NaverPlaceCrawler
+                    _get_place_crawler_cls()
                 except ImportError as e:
                     st.error(f"❌ 크롤러 모듈을 찾을 수 없습니다: {str(e)}")
                     st.info("💡 crawlers/ 폴더와 naver_place_crawler.py 파일을 확인하세요.")
@@ -410,44 +695,45 @@ def render_place_crawling():
                     st.error(f"❌ 크롤러 로드 중 오류 발생: {str(e)}")
                     return
 
-                # 크롤링 실행
-                crawler = NaverPlaceCrawler(headless=True, delay=0.5)
-
-                try:
-                    df = crawler.crawl_reviews(place_id, max_reviews=max_reviews)
-
-                    if df is not None and len(df) > 0:
-                        # 컬럼명 매핑
-                        df_mapped = df.rename(columns={
-                            'review': 'text',
-                            'rating': 'rating'
-                        })
-
-                        # 세션에 저장
-                        SessionManager.save_data(
-                            data=df_mapped,
-                            data_type='review',
-                            source='crawl_place',
-                            file_name=f'place_{place_id}_reviews.csv'
-                        )
-
-                        st.success(f"✅ 크롤링 완료! {len(df)}개 리뷰 수집")
-                        st.balloons()
-                        # 버그 #35 수정: 세션 상태 저장 완료 대기
-                        import time
-                        time.sleep(0.1)
-                        st.rerun()
-                    else:
-                        st.error("❌ 리뷰를 수집하지 못했습니다")
+                # 크롤링 실행 (캐싱된 브라우저 재사용, 다른 세션과 동시에 쓰지 않도록 잠금)
+                with _PLACE_CRAWL_LOCK:
+                    crawler = get_place_crawler()
+                    try:
+                        df = crawler.crawl_reviews(place_id, max_reviews=max_reviews)
+                    except Exception:
+                        # 브라우저가 비정상 상태일 수 있으므로 다음 요청에서 재생성
+                        crawler.close()
+                        get_place_crawler.clear()
+                        raise
+
+                if df is not None and len(df) > 0:
+                    # 컬럼명 매핑 (크롤러가 새로 만든 DataFrame이므로 복사 없이 제자리 변경)
+                    df.rename(columns={'review': 'text'}, inplace=True)
+
+                    # 세션에 저장
+                    SessionManager.save_data(
+                        data=downcast(df),
+                        data_type='review',
+                        source='crawl_place',
+                        file_name=f'place_{place_id}_reviews.csv'
+                    )
 
-                finally:
-                    crawler.close()
+                    st.success(f"✅ 크롤링 완료! {len(df)}개 리뷰 수집")
+                    st.balloons()
+                    # 세션 상태는 동기적으로 저장되므로 대기 없이 바로 재실행
+                    st.rerun()
+                else:
+                    st.error("❌ 리뷰를 수집하지 못했습니다")
 
         except Exception as e:
             st.error(f"❌ 크롤링 오류: {str(e)}")
-            st.exception(e)
+            logger.exception("크롤링 실패")
+            # 상세 traceback 화면 출력은 로컬 디버깅에서만
+            if Environment.is_local():
+                st.exception(e)
 
 
+@st.fragment
 def render_sample_data():
     """샘플 데이터 로드 UI"""
     st.markdown("#### 📦 샘플 데이터")
@@ -456,7 +742,7 @@ def render_sample_data():
         st.info("☁️ 배포 환경: 샘플 데이터를 사용하여 플랫폼을 체험하세요")
 
     # 샘플 데이터 목록
-    sample_files = Environment.list_sample_data()
+    sample_files = _sample_files()
 
     if not sample_files:
         st.warning("⚠️ 샘플 데이터가 없습니다. sample_data/ 폴더를 확인하세요.")
@@ -488,8 +774,8 @@ def render_sample_data():
             with st.spinner(f"📂 {selected_file} 로드 중..."):
                 sample_path = os.path.join(Environment.get_sample_data_path(), selected_file)
 
-                # DataLoader.load_file()을 사용하여 CSV/Excel 자동 처리
-                df = DataLoader.load_file(sample_path)
+                # DataLoader.load_file()을 사용하여 CSV/Excel 자동 처리 (캐싱)
+                df = _load_sample(sample_path, os.path.getmtime(sample_path))
 
                 # 데이터 타입 자동 감지
                 if 'ecommerce' in selected_file:
@@ -510,9 +796,7 @@ def render_sample_data():
                 )
 
                 st.success(f"✅ 샘플 데이터 로드 성공: {selected_file}")
-                # 버그 #35 수정: 세션 상태 저장 완료 대기
-                import time
-                time.sleep(0.1)
+                # 세션 상태는 동기적으로 저장되므로 대기 없이 바로 재실행
                 st.rerun()
 
         except Exception as e:
@@ -588,7 +872,6 @@ def page_auto_analysis():
         st.markdown("### 🤖 GPT 고급 분석 (선택)")
 
         # API 키 상태 확인
-        from utils.api_key_manager import APIKeyManager
         api_status = APIKeyManager.get_api_key_status()
 
         if api_status['available'] and api_status['valid']:
@@ -651,8 +934,6 @@ OPENAI_API_KEY = "sk-..."
 
 def run_analysis(analysis_type: str, use_gpt: bool = False):
     """분석 실행"""
-    import time
-
     data = SessionManager.get_data()
 
     if analysis_type == 'ecommerce':
@@ -665,8 +946,6 @@ def run_analysis(analysis_type: str, use_gpt: bool = False):
 
 def run_ecommerce_analysis(df: pd.DataFrame):
     """E-commerce RFM 분석 실행 (수정됨: 이전 GPT 결과 초기화 추가)"""
-    import time
-
     # [추가된 부분] 새로운 분석 시작 시 이전 GPT 결과 삭제
     if 'rfm_strategy' in st.session_state: del st.session_state['rfm_strategy']
     if 'rfm_simulation' in st.session_state: del st.session_state['rfm_simulation']
@@ -674,7 +953,8 @@ def run_ecommerce_analysis(df: pd.DataFrame):
     try:
         # 필수 컬럼 확인
         required_cols = ['customerid', 'invoicedate', 'quantity', 'unitprice']
-        df_cols_lower = [col.lower() for col in df.columns]
+        # 소문자 컬럼명 집합으로 멤버십 검사 (다른 run_* 함수와 같은 벡터화 소문자 변환)
+        df_cols_lower = set(df.columns.astype(str).str.lower())
 
         missing_cols = [col for col in required_cols if col not in df_cols_lower]
 
@@ -692,10 +972,7 @@ def run_ecommerce_analysis(df: pd.DataFrame):
         progress_bar.progress(20)
         preprocessor = DataPreprocessor(df)
         processed_df, logs = (preprocessor
-                             .normalize_column_names()
-                             .handle_missing_values(strategy='drop')
-                             .remove_duplicates()
-                             .convert_date_columns(['invoicedate'])
+                             .clean_for_analysis(['invoicedate'])
                              .get_processed_data())
 
         # 2. RFM 분석
@@ -717,12 +994,15 @@ def run_ecommerce_analysis(df: pd.DataFrame):
         optimal_k, metrics = rfm_analyzer.find_optimal_clusters()
         clustered_df = rfm_analyzer.perform_clustering()
         cluster_summary = rfm_analyzer.get_cluster_summary()
+        segment_counts = rfm_analyzer.get_segment_counts()
 
         # 4. 시각화 준비
         status_text.text("4/5 시각화 생성 중...")
         progress_bar.progress(80)
 
-        # 5. 결과 저장
+        # 5. 결과 저장 (세션에 오래 남는 결과 DataFrame은 숫자 컬럼 다운캐스팅)
+        # (실수는 float32 왕복 값이 정확히 같을 때만 변환하므로 금액/내보내기 값은 바뀌지 않음)
+        downcast_numeric(clustered_df)
         results = {
             'type': 'ecommerce',
             'rfm_df': rfm_df,
@@ -730,6 +1010,7 @@ def run_ecommerce_analysis(df: pd.DataFrame):
             'cluster_summary': cluster_summary,
             'optimal_k': optimal_k,
             'metrics': metrics,
+            'segment_counts': segment_counts,
             'analyzer': rfm_analyzer
         }
 
@@ -738,7 +1019,6 @@ def run_ecommerce_analysis(df: pd.DataFrame):
         # 완료
         progress_bar.progress(100)
         status_text.text("✅ 분석 완료!")
-        time.sleep(0.5)
         progress_bar.empty()
         status_text.empty()
 
@@ -749,24 +1029,43 @@ def run_ecommerce_analysis(df: pd.DataFrame):
     except Exception as e:
         SessionManager.clear_analysis()
         st.error(f"❌ 분석 중 오류 발생: {str(e)}")
-        st.exception(e)
+        logger.exception("분석 실패")
+        # 상세 traceback 화면 출력은 로컬 디버깅에서만
+        if Environment.is_local():
+            st.exception(e)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_review_pipeline(content_hash: str, text_col: str, rating_col, _df: pd.DataFrame) -> tuple:
+    """
+    GPT를 제외한 기본 리뷰 분석 (데이터 내용 해시 + 컬럼 기준 캐싱)
+
+    GPT 사용 여부만 바꿔 다시 분석할 때 전처리·감성 분석을 반복하지 않는다.
+    """
+    return _simple_review_pipeline(_df, text_col, rating_col)
+
+
+def _simple_review_pipeline(df: pd.DataFrame, text_col: str, rating_col) -> tuple:
+    """
+    전처리 → 기본 감성 분석 → 키워드 추출
+
+    Returns:
+        (전처리·감성 컬럼이 추가된 DataFrame, 키워드 dict)
+    """
+    analyzer = TextAnalyzer(df, text_column=text_col, rating_column=rating_col)
+    analyzer.preprocess_text()
+    analyzer.analyze_sentiment_simple()
+    return analyzer.df, analyzer.extract_keywords(top_n=20)
+
 
 def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
     """리뷰 감성 분석 실행 (수정됨: GPT 결과 병합 로직 추가)"""
-    import time
-    import random
-
     try:
-        # 텍스트 컬럼 찾기
-        text_col = None
-        rating_col = None
-
-        for col in df.columns:
-            col_lower = col.lower()
-            if 'review' in col_lower or 'text' in col_lower or 'comment' in col_lower:
-                text_col = col
-            if 'rating' in col_lower or 'score' in col_lower or 'point' in col_lower:
-                rating_col = col
+        # 텍스트 컬럼 찾기 (여러 개가 매칭되면 마지막 컬럼 사용)
+        cols_lower = df.columns.astype(str).str.lower()
+        text_mask = cols_lower.str.contains(r'review|text|comment', regex=True, na=False)
+        rating_mask = cols_lower.str.contains(r'rating|score|point', regex=True, na=False)
+        text_col = df.columns[text_mask][-1] if text_mask.any() else None
+        rating_col = df.columns[rating_mask][-1] if rating_mask.any() else None
 
         if not text_col:
             st.error("❌ 리뷰 텍스트 컬럼을 찾을 수 없습니다.")
@@ -776,68 +1075,50 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
         st.info(f"📝 텍스트 컬럼: **{text_col}**" + (f" | 평점 컬럼: **{rating_col}**" if rating_col else ""))
 
         # Progress bar
-        total_steps = 6 if use_gpt else 5
+        total_steps = 3 if use_gpt else 2
         progress_bar = st.progress(0)
         status_text = st.empty()
 
-        # 1. 텍스트 분석기 초기화
-        status_text.text(f"1/{total_steps} 텍스트 분석기 초기화 중...")
+        # 1~3. 전처리 → 기본 감성 분석 → 키워드 추출 (같은 데이터면 캐시 재사용)
+        status_text.text(f"1/{total_steps} 텍스트 전처리 및 기본 감성 분석 중...")
         progress_bar.progress(int(100 / total_steps * 1))
-        analyzer = TextAnalyzer(df, text_column=text_col, rating_column=rating_col)
-
-        # 2. 전처리
-        status_text.text(f"2/{total_steps} 텍스트 전처리 중...")
-        progress_bar.progress(int(100 / total_steps * 2))
-        analyzer.preprocess_text()
-
-        # 3. 감성 분석 (기본 1차 분석)
-        status_text.text(f"3/{total_steps} 기본 감성 분석 중...")
-        progress_bar.progress(int(100 / total_steps * 3))
-        analyzer.analyze_sentiment_simple()
-
-        # 4. 키워드 추출
-        status_text.text(f"4/{total_steps} 키워드 추출 중...")
-        progress_bar.progress(int(100 / total_steps * 4))
-        keywords = analyzer.extract_keywords(top_n=20)
+        content_hash = _df_content_hash(df)
+        if content_hash is not None:
+            processed_df, keywords = _cached_review_pipeline(content_hash, text_col, rating_col, df)
+        else:
+            processed_df, keywords = _simple_review_pipeline(df, text_col, rating_col)
+        analyzer = TextAnalyzer(processed_df, text_column=text_col, rating_column=rating_col)
+        analyzer.processed_texts = analyzer.df['processed_text'].tolist()
 
-        # 5. GPT 고급 분석 (선택)
+        # 4. GPT 고급 분석 (선택)
         gpt_results = None
         if use_gpt:
-            status_text.text(f"5/{total_steps} GPT로 정밀 분석 및 결과 병합 중...")
-            progress_bar.progress(int(100 / total_steps * 5))
+            status_text.text(f"2/{total_steps} GPT로 정밀 분석 및 결과 병합 중...")
+            progress_bar.progress(int(100 / total_steps * 2))
 
             try:
-                from modules.gpt_analyzer import GPTAnalyzer
-                from utils.api_key_manager import get_api_key
-
                 api_key = get_api_key()
                 if api_key:
                     gpt = GPTAnalyzer(api_key=api_key)
 
                     # --- [수정된 부분 시작] 데이터 추출 및 매핑 로직 ---
                     
-                    # 1. 분석 대상 선정 (여기서 직접 샘플링하여 인덱스를 보존함)
+                    # 1. 분석 대상 선정 (여기서 직접 샘플링하여 행 위치를 보존함)
                     # 부정(negative)이나 중립(neutral)인 것들을 우선적으로 재분석
-                    target_mask = analyzer.df['sentiment'].isin(['negative', 'neutral'])
-                    target_indices = analyzer.df[target_mask].index.tolist()
-                    
-                    # 대상이 너무 적으면 전체에서 샘플링
-                    if len(target_indices) < 10:
-                         target_indices = analyzer.df.index.tolist()
-
-                    # 최대 50개로 제한 (비용 관리)
-                    max_gpt_reviews = 500
-                    if len(target_indices) > max_gpt_reviews:
-                        target_indices = random.sample(target_indices, max_gpt_reviews)
-                    
-                    # 선택된 인덱스의 텍스트 추출
-                    target_reviews_text = analyzer.df.loc[target_indices, text_col].astype(str).tolist()
+                    # (대상이 너무 적으면 전체에서 샘플링, 최대 500개로 제한 - 비용 관리)
+                    target_positions = GPTAnalyzer.select_reanalysis_positions(
+                        analyzer.df['sentiment'], max_reviews=500
+                    )
+
+                    # 선택된 위치의 텍스트 추출
+                    target_reviews_text = analyzer.df[text_col].to_numpy()[target_positions].astype(str).tolist()
                     
                     # 2. GPT 분석 요청 (max_reviews를 텍스트 길이만큼 설정하여 내부 샘플링 방지)
                     gpt_sentiment_list = gpt.analyze_sentiment_batch(
                         reviews=target_reviews_text,
                         max_reviews=len(target_reviews_text), # 이미 위에서 잘랐으므로 그대로 다 분석
-                        filter_negative=False # 위에서 이미 필터링했으므로 False
+                        filter_negative=False, # 위에서 이미 필터링했으므로 False
+                        max_workers=GPTAnalyzer.MAX_CONCURRENT_BATCHES # 배치 요청 병렬 처리
                     )
 
                     # 3. 결과를 원본 DataFrame에 병합 (매우 중요!)
@@ -845,16 +1126,21 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
                     if 'gpt_reason' not in analyzer.df.columns:
                         analyzer.df['gpt_reason'] = None
                     
+                    # 유효한 결과만 위치 기준으로 배열에 반영한 뒤 컬럼 전체를 한 번에 교체
+                    # (.loc 라벨 인덱싱 없이 위치 인덱스로 갱신)
+                    new_sentiments = analyzer.df['sentiment'].to_numpy(dtype=object, copy=True)
+                    new_reasons = analyzer.df['gpt_reason'].to_numpy(dtype=object, copy=True)
+
                     update_count = 0
-                    for idx, result in zip(target_indices, gpt_sentiment_list):
-                        new_sentiment = result.get('sentiment')
-                        reason = result.get('reason')
-                        
-                        if new_sentiment in ['positive', 'negative', 'neutral']:
-                            # 원본 데이터프레임 업데이트
-                            analyzer.df.loc[idx, 'sentiment'] = new_sentiment
-                            analyzer.df.loc[idx, 'gpt_reason'] = reason
+                    for pos, result in zip(target_positions, gpt_sentiment_list):
+                        if result.get('sentiment') in ('positive', 'negative', 'neutral'):
+                            new_sentiments[pos] = result.get('sentiment')
+                            new_reasons[pos] = result.get('reason')
                             update_count += 1
+
+                    if update_count:
+                        analyzer.df['sentiment'] = new_sentiments
+                        analyzer.df['gpt_reason'] = new_reasons
                     
                     # --- [수정된 부분 끝] ---
 
@@ -871,10 +1157,12 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
 
             except Exception as e:
                 st.warning(f"⚠️ GPT 분석 중 오류 발생: {str(e)}")
-                import traceback
-                traceback.print_exc()
+                logger.exception("GPT 분석 실패")
 
-        # 6. 결과 저장
+        # 감성 라벨은 세 종류뿐이므로 category로 저장 (세션 메모리 절감, isin/value_counts 가속)
+        analyzer.df['sentiment'] = analyzer.df['sentiment'].astype('category')
+
+        # 5. 결과 저장
         results = {
             'type': 'review',
             'analyzer': analyzer, # 업데이트된 df가 포함된 analyzer 객체 저장
@@ -882,7 +1170,11 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
             'rating_col': rating_col,
             'keywords': keywords,
             'gpt_results': gpt_results,
-            'use_gpt': use_gpt
+            'use_gpt': use_gpt,
+            # 재실행마다 다시 계산하지 않도록 요약 통계는 분석 시점에 한 번만 계산
+            'review_count': len(analyzer.df),
+            'sentiment_counts': analyzer.df['sentiment'].value_counts().to_dict(),
+            'word_freq': analyzer.get_word_frequency(top_n=50)
         }
 
         SessionManager.save_results(results)
@@ -890,7 +1182,6 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
         # 완료
         progress_bar.progress(100)
         status_text.text("✅ 분석 완료!")
-        time.sleep(0.5)
         progress_bar.empty()
         status_text.empty()
 
@@ -901,30 +1192,98 @@ def run_review_analysis(df: pd.DataFrame, use_gpt: bool = False):
     except Exception as e:
         SessionManager.clear_analysis()
         st.error(f"❌ 분석 중 오류 발생: {str(e)}")
-        st.exception(e)
+        logger.exception("분석 실패")
+        # 상세 traceback 화면 출력은 로컬 디버깅에서만
+        if Environment.is_local():
+            st.exception(e)
+
+
+# 원화 금액 표시 형식 (st.dataframe column_config용)
+_WON_COLUMN = st.column_config.NumberColumn(format='%,.0f원')
+
+# 결과 페이지 고객 테이블 최대 표시 행 수 (전체 목록은 상세 탐색에서 필터/다운로드)
+_MAX_DISPLAY_ROWS = 1000
+
+# 기간별 이동평균 윈도우 (일별: 7일/30일, 주별: 4주, 월별: 3개월)
+_MA_WINDOWS = {'D': [7, 30], 'W': [4], 'M': [3]}
+
+
+def _build_sales_insights(pareto_summary: dict, growth_frames: dict, product_count: int) -> dict:
+    """
+    판매 분석 인사이트 문구 (분석 시점에 한 번만 생성)
+
+    Returns:
+        {'concentration_label': 매출 집중도 요약,
+         'concentration': (표시 함수명, 문구), 'diversity': (표시 함수명, 문구),
+         'growth': {기간: 성장률 추세 마크다운 또는 None}}
+    """
+    # 집중도 계산 (상위 20% 기여도)
+    concentration = pareto_summary['top_20_pct_contribution']
+    if concentration > 80:
+        concentration_label = "매우 집중됨 (소수 상품 의존도 높음)"
+        concentration_msg = ('warning', f"⚠️ **매출 집중도 높음**: 상위 20% 상품이 {concentration:.1f}% 기여 → 리스크 분산 필요")
+    elif concentration > 60:
+        concentration_label = "집중됨 (핵심 상품 관리 필요)"
+        concentration_msg = ('info', f"💡 **적정 집중도**: 상위 20% 상품이 {concentration:.1f}% 기여 → 핵심 상품 집중 관리")
+    else:
+        concentration_label = "분산됨 (다양한 상품 기여)"
+        concentration_msg = ('success', f"✅ **분산형 구조**: 상위 20% 상품이 {concentration:.1f}% 기여 → 다양한 상품 포트폴리오")
+
+    # 상품 다양성
+    if product_count > 50:
+        diversity_msg = ('success', f"✅ **상품 다양성 높음**: {product_count}개 상품 → 시장 니즈 다양화")
+    elif product_count > 20:
+        diversity_msg = ('info', f"💡 **적정 상품 수**: {product_count}개 상품 → 관리 가능한 범위")
+    else:
+        diversity_msg = ('warning', f"⚠️ **상품 다양성 부족**: {product_count}개 상품만 존재 → 상품 라인업 확대 검토")
+
+    # 기간별 성장률 추세
+    growth = {}
+    for period, df_growth in growth_frames.items():
+        growth[period] = None
+        if 'sales_growth' not in df_growth.columns:
+            continue
+        recent_growth = df_growth['sales_growth'].dropna().tail(5)
+        if recent_growth.empty:
+            continue
+        avg_recent_growth = recent_growth.mean()
+
+        if avg_recent_growth > 5:
+            growth_insight = f"✅ 최근 성장세 양호 (평균 {avg_recent_growth:.1f}% 상승)"
+            growth_color = "green"
+        elif avg_recent_growth > 0:
+            growth_insight = f"⚠️ 완만한 성장 (평균 {avg_recent_growth:.1f}% 상승)"
+            growth_color = "blue"
+        elif avg_recent_growth > -5:
+            growth_insight = f"⚠️ 소폭 하락 (평균 {avg_recent_growth:.1f}% 하락)"
+            growth_color = "orange"
+        else:
+            growth_insight = f"❌ 급격한 하락 (평균 {avg_recent_growth:.1f}% 하락)"
+            growth_color = "red"
+        growth[period] = f"**성장률 추세**: :{growth_color}[{growth_insight}]"
+
+    return {
+        'concentration_label': concentration_label,
+        'concentration': concentration_msg,
+        'diversity': diversity_msg,
+        'growth': growth,
+    }
 
 
 def run_sales_analysis(df: pd.DataFrame):
     """판매 분석 실행 (DAY 29-31 구현)"""
-    import time
-
     try:
-        # 필수 컬럼 찾기
-        date_col = None
-        product_col = None
-        quantity_col = None
-        price_col = None
-
-        for col in df.columns:
-            col_lower = col.lower()
-            if any(keyword in col_lower for keyword in ['date', '날짜', '일자']):
-                date_col = col
-            if any(keyword in col_lower for keyword in ['product', '상품', '제품', 'item']):
-                product_col = col
-            if any(keyword in col_lower for keyword in ['quantity', '수량', 'qty', 'amount']):
-                quantity_col = col
-            if any(keyword in col_lower for keyword in ['price', '가격', '단가', 'cost']):
-                price_col = col
+        # 필수 컬럼 찾기 (여러 개가 매칭되면 마지막 컬럼 사용)
+        cols_lower = df.columns.astype(str).str.lower()
+        date_mask = cols_lower.str.contains(r'date|날짜|일자', regex=True, na=False)
+        product_mask = cols_lower.str.contains(r'product|상품|제품|item', regex=True, na=False)
+        quantity_mask = cols_lower.str.contains(r'quantity|수량|qty|amount', regex=True, na=False)
+        price_mask = cols_lower.str.contains(r'price|가격|단가|cost', regex=True, na=False)
+
+        date_col = df.columns[date_mask][-1] if date_mask.any() else None
+        product_col = df.columns[product_mask][-1] if product_mask.any() else None
+        quantity_col = df.columns[quantity_mask][-1] if quantity_mask.any() else None
+        price_col = df.columns[price_mask][-1] if price_mask.any() else None
 
         # 필수 컬럼 검증
         missing_cols = []
@@ -945,9 +1304,8 @@ def run_sales_analysis(df: pd.DataFrame):
         status_text = st.empty()
 
         # 1. SalesAnalyzer 초기화
-        status_text.text("1/5 판매 분석기 초기화 중...")
+        status_text.text("1/3 판매 분석기 초기화 중...")
         progress_bar.progress(20)
-        from modules.sales_analyzer import SalesAnalyzer
         analyzer = SalesAnalyzer(
             df,
             date_column=date_col,
@@ -957,33 +1315,52 @@ def run_sales_analysis(df: pd.DataFrame):
         )
 
         # 2. 일별/주별/월별 집계
-        status_text.text("2/5 시계열 집계 중...")
+        status_text.text("2/3 시계열 집계 중...")
         progress_bar.progress(40)
-        daily = analyzer.aggregate_by_period('D')
-        weekly = analyzer.aggregate_by_period('W')
-        monthly = analyzer.aggregate_by_period('M')
-
-        # 3. 이동평균 계산
-        status_text.text("3/5 이동평균 계산 중...")
-        progress_bar.progress(60)
-        daily_ma = analyzer.calculate_moving_average(daily, 'sales', [7, 30])
-        weekly_ma = analyzer.calculate_moving_average(weekly, 'sales', [4])
-        monthly_ma = analyzer.calculate_moving_average(monthly, 'sales', [3])
+        # 원본은 일별로 한 번만 집계하고 주별/월별은 일별 결과에서 계산
+        aggregates = analyzer.aggregate_by_periods(['D', 'W', 'M'])
+
+        # 3. 기간별 이동평균/성장률 + 상품 분석 (서로 독립적이므로 동시 실행)
+        status_text.text("3/3 이동평균·성장률·상품 분석 중...")
+
+        def _per_period(period):
+            agg = aggregates[period]
+            ma = analyzer.calculate_moving_average(agg, 'sales', _MA_WINDOWS[period])
+            growth = analyzer.calculate_growth_rate(agg, 'sales', shift_periods=1)
+            return ma, growth
+
+        def _products():
+            top_products = analyzer.get_top_products(20, 'sales')
+            pareto_df, pareto_summary = analyzer.analyze_pareto('sales')
+            return top_products, pareto_df, pareto_summary
+
+        with ThreadPoolExecutor(max_workers=len(_MA_WINDOWS) + 1) as executor:
+            futures = {executor.submit(_per_period, period): period for period in _MA_WINDOWS}
+            futures[executor.submit(_products)] = 'products'
+            outputs = {}
+            for done, future in enumerate(as_completed(futures), start=1):
+                outputs[futures[future]] = future.result()
+                progress_bar.progress(40 + 50 * done // len(futures))
+
+        (daily_ma, daily_growth), (weekly_ma, weekly_growth), (monthly_ma, monthly_growth) = (
+            outputs['D'], outputs['W'], outputs['M']
+        )
+        top_products, pareto_df, pareto_summary = outputs['products']
 
-        # 4. 성장률 계산
-        status_text.text("4/5 성장률 계산 중...")
-        progress_bar.progress(80)
-        daily_growth = analyzer.calculate_growth_rate(daily, 'sales', shift_periods=1)
-        weekly_growth = analyzer.calculate_growth_rate(weekly, 'sales', shift_periods=1)
-        monthly_growth = analyzer.calculate_growth_rate(monthly, 'sales', shift_periods=1)
+        # 기간별 매출 요약 통계 (기간 전환마다 다시 계산하지 않도록 미리 계산)
+        period_stats = {
+            name: {stat: float(value) for stat, value in
+                   period_df['sales'].agg(['sum', 'mean', 'max', 'min']).items()}
+            for name, period_df in [('daily', daily_ma), ('weekly', weekly_ma), ('monthly', monthly_ma)]
+        }
 
-        # 5. 상품 분석 (TOP 20, Pareto)
-        status_text.text("5/5 상품 분석 중...")
-        progress_bar.progress(90)
-        top_products = analyzer.get_top_products(20, 'sales')
-        pareto_df, pareto_summary = analyzer.analyze_pareto('sales')
+        # 결과 저장 (세션에 오래 남는 결과 DataFrame은 숫자 컬럼 다운캐스팅)
+        # (실수는 float32 왕복 값이 정확히 같을 때만 변환하므로 매출/내보내기 값은 바뀌지 않음)
+        for result_df in (daily_ma, weekly_ma, monthly_ma,
+                          daily_growth, weekly_growth, monthly_growth,
+                          top_products, pareto_df):
+            downcast_numeric(result_df)
 
-        # 결과 저장
         results = {
             'type': 'sales',
             'analyzer': analyzer,
@@ -993,6 +1370,17 @@ def run_sales_analysis(df: pd.DataFrame):
             'daily_growth': daily_growth,
             'weekly_growth': weekly_growth,
             'monthly_growth': monthly_growth,
+            'period_stats': period_stats,
+            # 기간별 이동평균 컬럼명 (calculate_moving_average의 {column}_ma_{window} 규칙)
+            'ma_columns': {
+                name: [f'sales_ma_{window}' for window in _MA_WINDOWS[period]]
+                for name, period in [('daily', 'D'), ('weekly', 'W'), ('monthly', 'M')]
+            },
+            'insights': _build_sales_insights(
+                pareto_summary,
+                {'daily': daily_growth, 'weekly': weekly_growth, 'monthly': monthly_growth},
+                len(top_products)
+            ),
             'top_products': top_products,
             'pareto_df': pareto_df,
             'pareto_summary': pareto_summary,
@@ -1009,7 +1397,6 @@ def run_sales_analysis(df: pd.DataFrame):
         # 완료
         progress_bar.progress(100)
         status_text.text("✅ 분석 완료!")
-        time.sleep(0.5)
         progress_bar.empty()
         status_text.empty()
 
@@ -1024,7 +1411,10 @@ def run_sales_analysis(df: pd.DataFrame):
     except Exception as e:
         SessionManager.clear_analysis()
         st.error(f"❌ 분석 중 오류 발생: {str(e)}")
-        st.exception(e)
+        logger.exception("분석 실패")
+        # 상세 traceback 화면 출력은 로컬 디버깅에서만
+        if Environment.is_local():
+            st.exception(e)
 
 
 def show_analysis_results(analysis_type: str):
@@ -1051,41 +1441,35 @@ def show_ecommerce_results(results):
         st.metric("총 고객 수", f"{len(clustered_df):,}")
     with col2:
         st.metric("군집 개수", optimal_k)
+    # 세그먼트 고객 수는 분석 시 한 번만 계산하여 결과에 저장됨
+    segment_counts = results.get('segment_counts', {})
     with col3:
-        if 'cluster_name' in clustered_df.columns:
-            vip_count = len(clustered_df[clustered_df['cluster_name'].str.contains('VIP|충성', na=False)])
-        else:
-            vip_count = 0
-        st.metric("VIP/충성 고객", f"{vip_count:,}")
+        st.metric("VIP/충성 고객", f"{segment_counts.get('vip', 0):,}")
     with col4:
-        if 'cluster_name' in clustered_df.columns:
-            risk_count = len(clustered_df[clustered_df['cluster_name'].str.contains('이탈|휴면', na=False)])
-        else:
-            risk_count = 0
-        st.metric("이탈 위험", f"{risk_count:,}")
+        st.metric("이탈 위험", f"{segment_counts.get('risk', 0):,}")
 
     st.markdown("---")
 
     # 2. 시각화 탭
-    visualizer = Visualizer()
+    visualizer = get_visualizer()
     tab1, tab2, tab3 = st.tabs(["📊 RFM 히트맵", "📈 고객 분포", "📋 데이터"])
 
     with tab1:
         st.markdown("### RFM 히트맵")
-        fig_heatmap = visualizer.plot_rfm_heatmap(cluster_summary)
+        fig_heatmap = _cached_chart(results, 'rfm_heatmap', lambda: visualizer.plot_rfm_heatmap(cluster_summary))
         st.plotly_chart(fig_heatmap, use_container_width=True)
 
         st.markdown("### 군집별 지표")
-        fig_bar = visualizer.plot_cluster_bar_chart(cluster_summary)
+        fig_bar = _cached_chart(results, 'cluster_bar_chart', lambda: visualizer.plot_cluster_bar_chart(cluster_summary))
         st.plotly_chart(fig_bar, use_container_width=True)
 
     with tab2:
         st.markdown("### 고객 가치 피라미드")
-        fig_pyramid = visualizer.plot_customer_value_pyramid(cluster_summary)
+        fig_pyramid = _cached_chart(results, 'customer_value_pyramid', lambda: visualizer.plot_customer_value_pyramid(cluster_summary))
         st.plotly_chart(fig_pyramid, use_container_width=True)
 
         st.markdown("### 군집별 고객 분포")
-        fig_pie = visualizer.plot_cluster_distribution_pie(cluster_summary)
+        fig_pie = _cached_chart(results, 'cluster_distribution_pie', lambda: visualizer.plot_cluster_distribution_pie(cluster_summary))
         st.plotly_chart(fig_pie, use_container_width=True)
 
     with tab3:
@@ -1093,22 +1477,21 @@ def show_ecommerce_results(results):
         st.dataframe(cluster_summary, use_container_width=True)
 
         st.markdown("### 고객 세분화 데이터")
-        display_cols = []
-        for check_col in ['customerid', 'cluster', 'cluster_name', 'Recency', 'Frequency', 'Monetary']:
-            for col in clustered_df.columns:
-                if col.lower() == check_col.lower() and col not in display_cols:
-                    display_cols.append(col)
-        
-        st.dataframe(
-            clustered_df[display_cols] if display_cols else clustered_df,
-            use_container_width=True
-        )
+        lc_cols = _case_insensitive_cols(clustered_df)
+        display_cols = [lc_cols[name] for name in
+                        ['customerid', 'cluster', 'cluster_name', 'recency', 'frequency', 'monetary']
+                        if name in lc_cols]
+
+        # 수만 행 전체를 브라우저로 직렬화하지 않도록 상위 행만 표시
+        segment_df = clustered_df[display_cols] if display_cols else clustered_df
+        st.dataframe(segment_df.head(_MAX_DISPLAY_ROWS), use_container_width=True)
+        if len(segment_df) > _MAX_DISPLAY_ROWS:
+            st.caption(f"상위 {_MAX_DISPLAY_ROWS:,}명만 표시 (전체 {len(segment_df):,}명은 '상세 탐색'에서 필터링/다운로드)")
 
     # 3. [기존] 규칙 기반 인사이트 (유지됨)
     st.markdown("---")
     st.markdown("### 💡 기본 분석 인사이트")
 
-    from modules.insight_generator import InsightGenerator
     generator = InsightGenerator()
     insights = generator.generate_rfm_insights(results['rfm_df'], cluster_summary)
 
@@ -1127,7 +1510,6 @@ def show_ecommerce_results(results):
     st.markdown("---")
     st.markdown("### 🤖 GPT 마케팅 전략 컨설팅")
 
-    from utils.api_key_manager import get_api_key
     api_key = get_api_key()
 
     if api_key:
@@ -1137,7 +1519,6 @@ def show_ecommerce_results(results):
             if st.button("📢 세그먼트별 맞춤 전략 생성", use_container_width=True):
                 with st.spinner("GPT가 고객 데이터를 분석하여 마케팅 전략을 수립 중입니다..."):
                     try:
-                        from modules.gpt_analyzer import GPTAnalyzer
                         gpt = GPTAnalyzer(api_key=api_key)
                         strategy_text = gpt.generate_segment_strategy(results['cluster_summary'])
                         st.session_state['rfm_strategy'] = strategy_text
@@ -1148,7 +1529,6 @@ def show_ecommerce_results(results):
             if st.button("💰 매출 성장 시뮬레이션", use_container_width=True):
                 with st.spinner("GPT가 시나리오별 예상 매출을 계산 중입니다..."):
                     try:
-                        from modules.gpt_analyzer import GPTAnalyzer
                         gpt = GPTAnalyzer(api_key=api_key)
                         simulation_text = gpt.simulate_revenue_growth(
                             results['rfm_df'], results['cluster_summary']
@@ -1176,34 +1556,37 @@ def show_review_results(results: dict):
     analyzer = results['analyzer']
     text_col = results['text_col']
 
-    # 감성 분포
-    sentiment_counts = analyzer.df['sentiment'].value_counts()
+    # 감성 분포 (분석 시점에 계산된 값 사용)
+    sentiment_counts = results['sentiment_counts']
+    review_count = results['review_count']
 
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("총 리뷰 수", f"{len(analyzer.df):,}")
+        st.metric("총 리뷰 수", f"{review_count:,}")
     with col2:
-        positive_pct = (sentiment_counts.get('positive', 0) / len(analyzer.df) * 100)
+        positive_pct = (sentiment_counts.get('positive', 0) / review_count * 100)
         st.metric("긍정 비율", f"{positive_pct:.1f}%")
     with col3:
-        negative_pct = (sentiment_counts.get('negative', 0) / len(analyzer.df) * 100)
+        negative_pct = (sentiment_counts.get('negative', 0) / review_count * 100)
         st.metric("부정 비율", f"{negative_pct:.1f}%")
 
     st.markdown("---")
 
     # 시각화
-    visualizer = Visualizer()
+    visualizer = get_visualizer()
     tab1, tab2, tab3 = st.tabs(["📊 감성 분석", "☁️ 워드 클라우드", "📋 데이터"])
 
     with tab1:
         st.markdown("### 감성 분포")
-        fig_sentiment = visualizer.plot_sentiment_distribution(analyzer.df)
+        fig_sentiment = _cached_chart(results, 'sentiment_distribution',
+                                      lambda: visualizer.plot_sentiment_distribution(analyzer.df))
         st.plotly_chart(fig_sentiment, use_container_width=True)
 
         st.markdown("### 감성별 키워드 (Top 15)")
         keywords = results.get('keywords', {})
         if keywords:
-            fig_keywords = visualizer.plot_keywords_comparison(keywords)
+            fig_keywords = _cached_chart(results, 'keywords_comparison',
+                                         lambda: visualizer.plot_keywords_comparison(keywords))
             st.plotly_chart(fig_keywords, use_container_width=True)
         else:
             st.info("키워드 데이터가 없습니다.")
@@ -1211,17 +1594,11 @@ def show_review_results(results: dict):
     with tab2:
         st.markdown("### 전체 워드 클라우드")
         try:
-            # 단어 빈도 계산
-            from collections import Counter
-            all_words = []
-            if hasattr(analyzer, 'processed_texts') and analyzer.processed_texts:
-                for tokens in analyzer.processed_texts:
-                    if tokens:
-                        all_words.extend(tokens.split())
-
-            if all_words:
-                word_freq = Counter(all_words).most_common(50)
-                wordcloud_fig = visualizer.plot_word_cloud_data(word_freq, top_n=50)
+            # 단어 빈도 (분석 시점에 계산된 값 사용)
+            word_freq = results['word_freq']
+            if word_freq:
+                wordcloud_fig = _cached_chart(results, 'word_cloud',
+                                              lambda: visualizer.plot_word_cloud_data(word_freq, top_n=50))
                 st.plotly_chart(wordcloud_fig, use_container_width=True)
             else:
                 st.info("워드 클라우드를 생성할 데이터가 없습니다.")
@@ -1254,16 +1631,17 @@ def show_sales_results(results: dict):
 
     df_display = results[selected_period]
     df_growth = results[f'{selected_period}_growth']
+    stats = results['period_stats'][selected_period]
 
     # 상단 메트릭 카드
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_sales = df_display['sales'].sum()
+        total_sales = stats['sum']
         st.metric("총 매출", f"{total_sales:,.0f}원")
 
     with col2:
-        avg_sales = df_display['sales'].mean()
+        avg_sales = stats['mean']
         st.metric(f"{period} 평균", f"{avg_sales:,.0f}원")
 
     with col3:
@@ -1278,8 +1656,7 @@ def show_sales_results(results: dict):
     st.markdown("---")
 
     # 3개 탭 구성
-    from modules.visualizer import Visualizer
-    visualizer = Visualizer()
+    visualizer = get_visualizer()
 
     tab1, tab2, tab3 = st.tabs(["📈 트렌드", "🏆 상품", "💡 인사이트"])
 
@@ -1287,19 +1664,19 @@ def show_sales_results(results: dict):
     with tab1:
         st.markdown("### 매출 트렌드")
 
-        # 이동평균 컬럼 찾기
-        ma_cols = [col for col in df_display.columns if 'ma_' in col]
+        # 이동평균 컬럼 (분석 시점에 저장된 목록 사용)
+        ma_cols = results['ma_columns'][selected_period]
 
         # 트렌드 차트
         try:
-            fig_trend = visualizer.plot_sales_trend(
+            fig_trend = _cached_chart(results, f'sales_trend_{selected_period}', lambda: visualizer.plot_sales_trend(
                 df_display,
                 date_column='date',
                 sales_column='sales',
                 ma_columns=ma_cols if ma_cols else None,
                 title=f'{period} 매출 트렌드' + (' (이동평균 포함)' if ma_cols else ''),
                 currency='원'
-            )
+            ))
             st.plotly_chart(fig_trend, use_container_width=True)
         except Exception as e:
             st.error(f"차트 생성 실패: {str(e)}")
@@ -1324,12 +1701,13 @@ def show_sales_results(results: dict):
 
         growth_display_renamed = growth_display[display_cols].rename(columns=rename_map)
 
-        # 포맷팅
+        # 포맷팅 (Styler 대신 column_config: 셀별 Python 포맷팅 없이 프런트엔드에서 처리)
         st.dataframe(
-            growth_display_renamed.style.format({
-                '매출': '{:,.0f}원',
-                '성장률(%)': '{:.1f}%'
-            }),
+            growth_display_renamed,
+            column_config={
+                '매출': _WON_COLUMN,
+                '성장률(%)': st.column_config.NumberColumn(format='%.1f%%')
+            },
             use_container_width=True
         )
 
@@ -1341,14 +1719,14 @@ def show_sales_results(results: dict):
 
         # 순위 차트
         try:
-            fig_products = visualizer.plot_top_products_bar(
+            fig_products = _cached_chart(results, 'top_products_bar', lambda: visualizer.plot_top_products_bar(
                 top_products,
                 product_column='product',
                 sales_column='sales',
                 top_n=20,
                 title='상품별 매출 순위 TOP 20',
                 currency='원'
-            )
+            ))
             st.plotly_chart(fig_products, use_container_width=True)
         except Exception as e:
             st.error(f"차트 생성 실패: {str(e)}")
@@ -1360,7 +1738,7 @@ def show_sales_results(results: dict):
         pareto_df = results['pareto_df']
 
         try:
-            fig_pareto = visualizer.plot_pareto_chart(
+            fig_pareto = _cached_chart(results, 'pareto_chart', lambda: visualizer.plot_pareto_chart(
                 pareto_df,
                 product_column='product',
                 sales_column='sales',
@@ -1369,7 +1747,7 @@ def show_sales_results(results: dict):
                 threshold=80.0,
                 title='파레토 분석 - 매출 기여도',
                 currency='원'
-            )
+            ))
             st.plotly_chart(fig_pareto, use_container_width=True)
         except Exception as e:
             st.error(f"차트 생성 실패: {str(e)}")
@@ -1393,8 +1771,8 @@ def show_sales_results(results: dict):
             st.markdown("**매출 통계**")
             st.metric("총 매출", f"{total_sales:,.0f}원")
             st.metric("평균 매출", f"{avg_sales:,.0f}원")
-            st.metric("최대 매출", f"{df_display['sales'].max():,.0f}원")
-            st.metric("최소 매출", f"{df_display['sales'].min():,.0f}원")
+            st.metric("최대 매출", f"{stats['max']:,.0f}원")
+            st.metric("최소 매출", f"{stats['min']:,.0f}원")
 
         with col2:
             st.markdown("**상품 통계**")
@@ -1402,55 +1780,22 @@ def show_sales_results(results: dict):
             st.metric("상위 20% 상품", f"{pareto_summary['top_20_pct_products']}개")
             st.metric("80% 매출 달성 상품", f"{pareto_summary['top_80_pct_products']}개")
 
-            # 집중도 계산 (상위 20% 기여도)
-            concentration = pareto_summary['top_20_pct_contribution']
-            if concentration > 80:
-                insight = "매우 집중됨 (소수 상품 의존도 높음)"
-            elif concentration > 60:
-                insight = "집중됨 (핵심 상품 관리 필요)"
-            else:
-                insight = "분산됨 (다양한 상품 기여)"
-            st.metric("매출 집중도", insight)
+            # 인사이트 문구는 분석 시점에 생성된 값 사용
+            insights = results['insights']
+            st.metric("매출 집중도", insights['concentration_label'])
 
         st.markdown("---")
         st.markdown("### 💡 기본 인사이트")
 
         # 성장률 분석
-        if 'sales_growth' in df_growth.columns:
-            recent_growth = df_growth['sales_growth'].dropna().tail(5)
-            if not recent_growth.empty:
-                avg_recent_growth = recent_growth.mean()
-
-                if avg_recent_growth > 5:
-                    growth_insight = f"✅ 최근 성장세 양호 (평균 {avg_recent_growth:.1f}% 상승)"
-                    growth_color = "green"
-                elif avg_recent_growth > 0:
-                    growth_insight = f"⚠️ 완만한 성장 (평균 {avg_recent_growth:.1f}% 상승)"
-                    growth_color = "blue"
-                elif avg_recent_growth > -5:
-                    growth_insight = f"⚠️ 소폭 하락 (평균 {avg_recent_growth:.1f}% 하락)"
-                    growth_color = "orange"
-                else:
-                    growth_insight = f"❌ 급격한 하락 (평균 {avg_recent_growth:.1f}% 하락)"
-                    growth_color = "red"
-
-                st.markdown(f"**성장률 추세**: :{growth_color}[{growth_insight}]")
+        growth_markdown = insights['growth'].get(selected_period)
+        if growth_markdown:
+            st.markdown(growth_markdown)
 
-        # 파레토 인사이트
-        if concentration > 80:
-            st.warning(f"⚠️ **매출 집중도 높음**: 상위 20% 상품이 {concentration:.1f}% 기여 → 리스크 분산 필요")
-        elif concentration > 60:
-            st.info(f"💡 **적정 집중도**: 상위 20% 상품이 {concentration:.1f}% 기여 → 핵심 상품 집중 관리")
-        else:
-            st.success(f"✅ **분산형 구조**: 상위 20% 상품이 {concentration:.1f}% 기여 → 다양한 상품 포트폴리오")
-
-        # 상품 다양성
-        if len(top_products) > 50:
-            st.success(f"✅ **상품 다양성 높음**: {len(top_products)}개 상품 → 시장 니즈 다양화")
-        elif len(top_products) > 20:
-            st.info(f"💡 **적정 상품 수**: {len(top_products)}개 상품 → 관리 가능한 범위")
-        else:
-            st.warning(f"⚠️ **상품 다양성 부족**: {len(top_products)}개 상품만 존재 → 상품 라인업 확대 검토")
+        # 파레토 인사이트 / 상품 다양성
+        for key in ('concentration', 'diversity'):
+            level, message = insights[key]
+            getattr(st, level)(message)
 
 
 def page_explore():
@@ -1468,6 +1813,7 @@ def page_explore():
 
     st.markdown("### 🔧 필터링 및 검색")
 
+    # 필터 패널은 fragment: 사이드바 필터 조작 시 페이지 전체가 아닌 패널만 다시 실행
     if analysis_type == 'ecommerce':
         render_ecommerce_filters(results)
     elif analysis_type == 'review':
@@ -1476,6 +1822,75 @@ def page_explore():
         render_sales_filters(results)
 
 
+def _search_column(results: dict, name: str, series: pd.Series) -> pd.Series:
+    """
+    검색용 Arrow 문자열 컬럼
+
+    분석 결과 딕셔너리(세션에 저장됨)에 한 번만 만들어 두고 재실행 간 재사용.
+    Arrow 문자열은 str.contains(regex=False)가 Python 루프 대신 Arrow 연산으로 처리된다.
+    """
+    cache = results.setdefault('search_columns', {})
+    if name not in cache:
+        cache[name] = series.astype(str).astype('string[pyarrow]')
+    return cache[name]
+
+
+def _case_insensitive_cols(df: pd.DataFrame) -> dict:
+    """소문자 컬럼명 → 실제 컬럼명 (대소문자만 다른 컬럼이 여러 개면 첫 번째 컬럼)"""
+    lc_map = {}
+    for col in df.columns:
+        lc_map.setdefault(str(col).lower(), col)
+    return lc_map
+
+
+def _filter_bounds(results: dict, name: str, compute):
+    """
+    사이드바 필터용 범위/선택지
+
+    분석 결과는 필터 조작 중 바뀌지 않으므로 결과 딕셔너리에 한 번만 계산해 두고
+    재실행마다 전체 컬럼 min/max/unique를 다시 구하지 않는다.
+    """
+    bounds = results.setdefault('filter_bounds', {})
+    if name not in bounds:
+        bounds[name] = compute()
+    return bounds[name]
+
+
+def _cached_chart(results: dict, name: str, build):
+    """
+    결과 차트 (Plotly Figure)
+
+    차트 입력은 분석 결과뿐이므로 결과 딕셔너리에 한 번만 만들어 두고
+    탭 전환/필터 조작 등 재실행마다 Figure를 다시 생성하지 않는다.
+    """
+    charts = results.setdefault('charts', {})
+    if name not in charts:
+        charts[name] = build()
+    return charts[name]
+
+
+# 필터 결과를 보관할 최근 필터 조건 개수
+_FILTER_MEMO_SIZE = 16
+
+
+def _memoize_filter(results: dict, key: tuple, compute):
+    """
+    필터 결과 (마스크, 합계 등)
+
+    같은 필터 조건으로 다시 실행되면 결과 딕셔너리에 보관된 값을 재사용.
+    슬라이더 조작마다 조건이 늘어나므로 최근 조건만 보관한다.
+    """
+    memo = results.setdefault('filter_memo', {})
+    if key in memo:
+        memo[key] = memo.pop(key)  # 최근 사용 순서로 갱신
+    else:
+        memo[key] = compute()
+        while len(memo) > _FILTER_MEMO_SIZE:
+            memo.pop(next(iter(memo)))
+    return memo[key]
+
+
+@st.fragment
 def render_ecommerce_filters(results: dict):
     """E-commerce 필터링 UI"""
     clustered_df = results.get('clustered_df')
@@ -1491,6 +1906,9 @@ def render_ecommerce_filters(results: dict):
         st.error("❌ 분석 결과 데이터를 찾을 수 없습니다.")
         return
 
+    # 대소문자 구분 없이 컬럼 찾기
+    lc_cols = _case_insensitive_cols(display_df)
+
     # 사이드바 필터
     with st.sidebar:
         st.markdown("---")
@@ -1498,7 +1916,9 @@ def render_ecommerce_filters(results: dict):
 
         # 군집 선택 (cluster_name이 있는 경우만)
         if 'cluster_name' in display_df.columns:
-            all_clusters = sorted(display_df['cluster_name'].unique())
+            all_clusters = _filter_bounds(
+                results, 'clusters', lambda: sorted(display_df['cluster_name'].unique())
+            )
             selected_clusters = st.multiselect(
                 "군집 선택",
                 options=all_clusters,
@@ -1511,19 +1931,16 @@ def render_ecommerce_filters(results: dict):
         # RFM 범위 슬라이더
         st.markdown("**Recency 범위 (일)**")
         # 버그 #34 수정: min == max 체크
-        # 대소문자 구분 없이 컬럼 찾기
-        recency_col = None
-        for col in display_df.columns:
-            if col.lower() == 'recency':
-                recency_col = col
-                break
+        recency_col = lc_cols.get('recency')
 
         if recency_col is None:
             st.warning("⚠️ Recency 데이터가 없습니다.")
             r_min, r_max = 0, 0
         else:
-            r_min_val = int(display_df[recency_col].min())
-            r_max_val = int(display_df[recency_col].max())
+            r_min_val, r_max_val = _filter_bounds(
+                results, 'recency',
+                lambda: (int(display_df[recency_col].min()), int(display_df[recency_col].max()))
+            )
             if r_min_val < r_max_val:
                 r_min, r_max = st.slider(
                     "Recency",
@@ -1539,18 +1956,16 @@ def render_ecommerce_filters(results: dict):
 
         st.markdown("**Frequency 범위 (건)**")
         # 버그 #34 수정: min == max 체크
-        frequency_col = None
-        for col in display_df.columns:
-            if col.lower() == 'frequency':
-                frequency_col = col
-                break
+        frequency_col = lc_cols.get('frequency')
 
         if frequency_col is None:
             st.warning("⚠️ Frequency 데이터가 없습니다.")
             f_min, f_max = 0, 0
         else:
-            f_min_val = int(display_df[frequency_col].min())
-            f_max_val = int(display_df[frequency_col].max())
+            f_min_val, f_max_val = _filter_bounds(
+                results, 'frequency',
+                lambda: (int(display_df[frequency_col].min()), int(display_df[frequency_col].max()))
+            )
             if f_min_val < f_max_val:
                 f_min, f_max = st.slider(
                     "Frequency",
@@ -1566,18 +1981,16 @@ def render_ecommerce_filters(results: dict):
 
         st.markdown("**Monetary 범위 (원)**")
         # 버그 #34 수정: min == max 체크
-        monetary_col = None
-        for col in display_df.columns:
-            if col.lower() == 'monetary':
-                monetary_col = col
-                break
+        monetary_col = lc_cols.get('monetary')
 
         if monetary_col is None:
             st.warning("⚠️ Monetary 데이터가 없습니다.")
             m_min, m_max = 0, 0
         else:
-            m_min_val = float(display_df[monetary_col].min())
-            m_max_val = float(display_df[monetary_col].max())
+            m_min_val, m_max_val = _filter_bounds(
+                results, 'monetary',
+                lambda: (float(display_df[monetary_col].min()), float(display_df[monetary_col].max()))
+            )
             if m_min_val < m_max_val:
                 m_min, m_max = st.slider(
                     "Monetary",
@@ -1591,26 +2004,10 @@ def render_ecommerce_filters(results: dict):
                 st.info(f"모든 고객의 Monetary: ₩{m_min_val:,.0f}")
                 m_min, m_max = m_min_val, m_max_val
 
-    # 필터 적용 (버그 #38 수정: .copy() 추가)
     # RFM 컬럼이 모두 있는지 확인 (대소문자 무관)
-    if recency_col is None or frequency_col is None or monetary_col is None:
+    rfm_missing = recency_col is None or frequency_col is None or monetary_col is None
+    if rfm_missing:
         st.error("❌ RFM 데이터가 없습니다. 분석을 다시 실행해주세요.")
-        filtered_df = display_df.copy()
-    elif selected_clusters is not None and 'cluster_name' in display_df.columns:
-        # 군집 + RFM 필터링
-        filtered_df = display_df[
-            (display_df['cluster_name'].isin(selected_clusters)) &
-            (display_df[recency_col].between(r_min, r_max)) &
-            (display_df[frequency_col].between(f_min, f_max)) &
-            (display_df[monetary_col].between(m_min, m_max))
-        ].copy()
-    else:
-        # RFM만 필터링
-        filtered_df = display_df[
-            (display_df[recency_col].between(r_min, r_max)) &
-            (display_df[frequency_col].between(f_min, f_max)) &
-            (display_df[monetary_col].between(m_min, m_max))
-        ].copy()
 
     # 검색
     search_query = st.text_input(
@@ -1619,13 +2016,35 @@ def render_ecommerce_filters(results: dict):
         key="customer_search"
     )
 
-    if search_query:
-        # 버그 #39 수정: regex 이스케이핑 추가
-        import re
-        escaped_query = re.escape(search_query)
-        filtered_df = filtered_df[
-            filtered_df['customerid'].astype(str).str.contains(escaped_query, case=False, na=False)
-        ]
+    def _compute_filter():
+        # 필터 적용: 조건별 중간 DataFrame/마스크 없이 하나의 boolean 마스크에 누적
+        mask = np.ones(len(display_df), dtype=bool)
+        if not rfm_missing:
+            for col, low, high in ((recency_col, r_min, r_max),
+                                   (frequency_col, f_min, f_max),
+                                   (monetary_col, m_min, m_max)):
+                values = display_df[col].to_numpy()
+                mask &= values >= low
+                mask &= values <= high
+            # 군집 필터링
+            if selected_clusters is not None and 'cluster_name' in display_df.columns:
+                mask &= display_df['cluster_name'].isin(selected_clusters).to_numpy()
+
+        if search_query:
+            # 버그 #39: 정규식 대신 리터럴 부분 문자열 검색 (이스케이프 불필요)
+            customer_ids = _search_column(results, 'customerid', display_df['customerid'])
+            mask &= customer_ids.str.contains(search_query, case=False, regex=False).to_numpy(dtype=bool)
+
+        total_monetary = display_df[monetary_col][mask].sum() if not rfm_missing else 0
+        return mask, total_monetary
+
+    # 필터 조건이 그대로인 재실행(탭/다른 위젯 조작)에서는 이전 마스크와 합계 재사용
+    filter_key = ('ecommerce', tuple(selected_clusters) if selected_clusters is not None else None,
+                  r_min, r_max, f_min, f_max, m_min, m_max, search_query)
+    mask, total_monetary = _memoize_filter(results, filter_key, _compute_filter)
+
+    # boolean 인덱싱 결과는 이미 새 DataFrame이고 이후에는 읽기만 하므로 .copy() 불필요
+    filtered_df = display_df[mask]
 
     # 결과 표시
     col1, col2, col3 = st.columns(3)
@@ -1639,7 +2058,7 @@ def render_ecommerce_filters(results: dict):
         col2.metric("전체 대비 비율", "N/A")
 
     if len(filtered_df) > 0 and monetary_col and monetary_col in filtered_df.columns:
-        col3.metric("총 매출액", f"₩{filtered_df[monetary_col].sum():,.0f}")
+        col3.metric("총 매출액", f"₩{total_monetary:,.0f}")
     else:
         col3.metric("총 매출액", "₩0")
 
@@ -1674,15 +2093,17 @@ def render_ecommerce_filters(results: dict):
         )
 
         # CSV 다운로드
-        csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
+        # 필터 키가 같으면 전체 내용 해시 없이 이전에 만든 CSV 재사용
+        csv = _filtered_csv(_analysis_token(results), filter_key, filtered_df)
         st.download_button(
             label="📥 필터링된 데이터 CSV 다운로드",
             data=csv,
-            file_name=f"filtered_customers_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+            file_name=f"filtered_customers_{date.today().strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
 
 
+@st.fragment
 def render_review_filters(results):
     """리뷰 필터링 UI (GPT 결과 시각화 강화 버전)"""
     analyzer = results['analyzer']
@@ -1694,7 +2115,8 @@ def render_review_filters(results):
         st.markdown("### 🔍 필터 옵션")
 
         # [NEW] GPT 분석 데이터가 있는지 확인
-        has_gpt_data = 'gpt_reason' in analyzer.df.columns and analyzer.df['gpt_reason'].notna().any()
+        # (GPT 재분석이 gpt_reason을 나중에 채울 수 있으므로 캐시하지 않고 매번 확인)
+        has_gpt_data = 'gpt_reason' in analyzer.df.columns and bool(analyzer.df['gpt_reason'].notna().any())
         
         show_only_gpt = False
         if has_gpt_data:
@@ -1703,7 +2125,9 @@ def render_review_filters(results):
 
         # 감성 필터
         if 'sentiment' in analyzer.df.columns:
-            all_sentiments = sorted(analyzer.df['sentiment'].unique())
+            all_sentiments = _filter_bounds(
+                results, 'sentiments', lambda: sorted(analyzer.df['sentiment'].unique())
+            )
             selected_sentiments = st.multiselect(
                 "감성 선택",
                 options=all_sentiments,
@@ -1716,8 +2140,10 @@ def render_review_filters(results):
         # 평점 범위 (있을 경우)
         if 'rating' in analyzer.df.columns:
             st.markdown("**평점 범위**")
-            rating_min_val = float(analyzer.df['rating'].min())
-            rating_max_val = float(analyzer.df['rating'].max())
+            rating_min_val, rating_max_val = _filter_bounds(
+                results, 'rating',
+                lambda: (float(analyzer.df['rating'].min()), float(analyzer.df['rating'].max()))
+            )
             
             if rating_min_val < rating_max_val:
                 rating_min, rating_max = st.slider(
@@ -1733,18 +2159,20 @@ def render_review_filters(results):
                 rating_min, rating_max = rating_min_val, rating_max_val
             
     # --- 필터링 로직 ---
-    filtered_df = analyzer.df.copy()
+    # 필터마다 중간 DataFrame을 만들지 않고 원본 행 위치 기준 boolean 마스크에 누적
+    review_df = analyzer.df
+    mask = np.ones(len(review_df), dtype=bool)
 
     # 1. GPT 필터 (체크박스 선택 시)
     if show_only_gpt and has_gpt_data:
-        filtered_df = filtered_df[filtered_df['gpt_reason'].notna()]
+        mask &= review_df['gpt_reason'].notna().to_numpy()
 
     # 2. 감성 필터
-    filtered_df = filtered_df[filtered_df['sentiment'].isin(selected_sentiments)]
+    mask &= review_df['sentiment'].isin(selected_sentiments).to_numpy()
 
     # 3. 평점 필터
-    if 'rating' in analyzer.df.columns:
-        filtered_df = filtered_df[filtered_df['rating'].between(rating_min, rating_max)]
+    if 'rating' in review_df.columns:
+        mask &= review_df['rating'].between(rating_min, rating_max).to_numpy(dtype=bool)
 
     # 4. 검색 필터
     search_query = st.text_input(
@@ -1754,11 +2182,13 @@ def render_review_filters(results):
     )
 
     if search_query:
-        import re
-        escaped_query = re.escape(search_query)
-        filtered_df = filtered_df[
-            filtered_df[text_col].astype(str).str.contains(escaped_query, case=False, na=False)
-        ]
+        # 정규식 대신 리터럴 부분 문자열 검색 (이스케이프 불필요)
+        # 캐시된 전체 컬럼에서 한 번에 검색하고 위치 기준으로 결합 (라벨 재정렬 없음)
+        review_texts = _search_column(results, text_col, review_df[text_col])
+        mask &= review_texts.str.contains(search_query, case=False, regex=False).to_numpy(dtype=bool)
+
+    # boolean 인덱싱 결과는 새 DataFrame이고 이후에는 읽기만 하므로 복사하지 않음
+    filtered_df = review_df[mask]
 
     # --- 결과 표시 ---
     col1, col2, col3 = st.columns(3)
@@ -1802,15 +2232,20 @@ def render_review_filters(results):
         )
 
         # CSV 다운로드
-        csv = filtered_df.to_csv(index=False, encoding='utf-8-sig')
+        # 같은 필터 조합이면 전체 내용 해시 없이 이전에 만든 CSV 재사용
+        review_key = ('review_csv', show_only_gpt, tuple(selected_sentiments),
+                      (rating_min, rating_max) if 'rating' in analyzer.df.columns else None,
+                      search_query)
+        csv = _filtered_csv(_analysis_token(results), review_key, filtered_df)
         st.download_button(
             label="📥 필터링된 리뷰 CSV 다운로드",
             data=csv,
-            file_name=f"filtered_reviews_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+            file_name=f"filtered_reviews_{date.today().strftime('%Y%m%d')}.csv",
             mime="text/csv"
         )
 
 
+@st.fragment
 def render_sales_filters(results: dict):
     """판매 분석 필터링 UI (DAY 31 구현)"""
 
@@ -1825,8 +2260,10 @@ def render_sales_filters(results: dict):
 
         # 날짜 범위 선택
         if not daily.empty and 'date' in daily.columns:
-            min_date = daily['date'].min()
-            max_date = daily['date'].max()
+            # st.date_input이 반환하는 datetime.date와 같은 타입으로 한 번만 변환
+            min_date, max_date = _filter_bounds(
+                results, 'date', lambda: (daily['date'].min().date(), daily['date'].max().date())
+            )
 
             st.markdown("**날짜 범위**")
             date_range = st.date_input(
@@ -1848,8 +2285,9 @@ def render_sales_filters(results: dict):
         # 매출 범위 슬라이더
         st.markdown("**매출 범위**")
         if not daily.empty and 'sales' in daily.columns:
-            sales_min = int(daily['sales'].min())
-            sales_max = int(daily['sales'].max())
+            sales_min, sales_max = _filter_bounds(
+                results, 'sales', lambda: (int(daily['sales'].min()), int(daily['sales'].max()))
+            )
 
             if sales_min < sales_max:
                 sales_range = st.slider(
@@ -1867,21 +2305,37 @@ def render_sales_filters(results: dict):
         else:
             sales_range = (0, 0)
 
-    # 필터링 로직
-    filtered_daily = daily.copy()
-
-    # 날짜 필터링
-    if start_date and end_date and 'date' in filtered_daily.columns:
-        filtered_daily = filtered_daily[
-            (filtered_daily['date'].dt.date >= start_date) &
-            (filtered_daily['date'].dt.date <= end_date)
-        ]
-
-    # 매출 필터링
-    if 'sales' in filtered_daily.columns:
-        filtered_daily = filtered_daily[
-            filtered_daily['sales'].between(sales_range[0], sales_range[1])
-        ]
+    # 필터링 로직 (boolean 인덱싱 결과만 사용하고 원본은 수정하지 않으므로 복사하지 않음)
+    def _compute_filter():
+        mask = np.ones(len(daily), dtype=bool)
+
+        # 날짜 필터링 (.dt.date로 행마다 date 객체를 만들지 않고 datetime64끼리 비교)
+        if start_date and end_date and 'date' in daily.columns:
+            dates = daily['date'].to_numpy()
+            low = np.datetime64(start_date)
+            high = np.datetime64(end_date) + np.timedelta64(1, 'D')
+            if daily['date'].is_monotonic_increasing:
+                # 집계 결과는 날짜순이므로 이진 탐색으로 구간 경계만 찾음
+                start_idx, end_idx = np.searchsorted(dates, [low, high], side='left')
+                mask[:start_idx] = False
+                mask[end_idx:] = False
+            else:
+                mask &= (dates >= low) & (dates < high)
+
+        # 매출 필터링
+        total_sales = 0
+        if 'sales' in daily.columns:
+            sales = daily['sales'].to_numpy()
+            mask &= sales >= sales_range[0]
+            mask &= sales <= sales_range[1]
+            total_sales = daily['sales'][mask].sum()
+        return mask, total_sales
+
+    # 필터 조건이 그대로인 재실행(탭/다른 위젯 조작)에서는 이전 마스크와 합계 재사용
+    filter_key = ('sales', start_date, end_date, tuple(sales_range))
+    mask, total_sales = _memoize_filter(results, filter_key, _compute_filter)
+    # 기본값(전체 범위)처럼 걸러지는 행이 없으면 인덱싱 복사 없이 원본을 그대로 읽기 전용으로 사용
+    filtered_daily = daily if mask.all() else daily[mask]
 
     # 상품 검색
     search_query = st.text_input(
@@ -1890,12 +2344,12 @@ def render_sales_filters(results: dict):
         key="product_search"
     )
 
-    filtered_products = top_products.copy()
+    filtered_products = top_products
     if search_query:
-        import re
-        escaped_query = re.escape(search_query)
+        # 정규식 대신 리터럴 부분 문자열 검색 (이스케이프 불필요)
+        product_names = _search_column(results, 'product', top_products['product'])
         filtered_products = filtered_products[
-            filtered_products['product'].astype(str).str.contains(escaped_query, case=False, na=False)
+            product_names.str.contains(search_query, case=False, regex=False).to_numpy(dtype=bool)
         ]
 
     # 결과 메트릭
@@ -1913,7 +2367,6 @@ def render_sales_filters(results: dict):
 
     with col3:
         if not filtered_daily.empty and 'sales' in filtered_daily.columns:
-            total_sales = filtered_daily['sales'].sum()
             st.metric("총 매출", f"{total_sales:,.0f}원")
         else:
             st.metric("총 매출", "0원")
@@ -1929,20 +2382,18 @@ def render_sales_filters(results: dict):
 
         with tab1:
             st.markdown("### 일별 매출 데이터")
-            # 날짜 내림차순 정렬
-            display_daily = filtered_daily.sort_values('date', ascending=False)
+            # 날짜 내림차순 정렬 (집계 결과는 이미 날짜순이므로 뒤집기만 함)
+            if daily['date'].is_monotonic_increasing:
+                display_daily = filtered_daily.iloc[::-1]
+            else:
+                display_daily = filtered_daily.sort_values('date', ascending=False, kind='stable')
 
             # 컬럼 선택 (date, sales, 이동평균)
-            display_cols = ['date', 'sales']
-            for col in display_daily.columns:
-                if 'ma_' in col:
-                    display_cols.append(col)
+            display_cols = ['date', 'sales'] + results['ma_columns']['daily']
 
             st.dataframe(
-                display_daily[display_cols].style.format({
-                    'sales': '{:,.0f}원',
-                    **{col: '{:,.0f}원' for col in display_cols if 'ma_' in col}
-                }),
+                display_daily[display_cols],
+                column_config={col: _WON_COLUMN for col in display_cols if col != 'date'},
                 use_container_width=True
             )
 
@@ -1953,10 +2404,11 @@ def render_sales_filters(results: dict):
                 st.warning(f"⚠️ '{search_query}' 검색 결과가 없습니다.")
             else:
                 st.dataframe(
-                    filtered_products.style.format({
-                        'sales': '{:,.0f}원',
-                        'quantity': '{:,.0f}개'
-                    }),
+                    filtered_products,
+                    column_config={
+                        'sales': _WON_COLUMN,
+                        'quantity': st.column_config.NumberColumn(format='%,.0f개')
+                    },
                     use_container_width=True
                 )
 
@@ -1973,26 +2425,30 @@ def page_export():
 
     results = SessionManager.get_results()
     analysis_type = results.get('type')
+    # 다운로드 파일명 날짜 (버튼마다 따로 구하지 않고 한 번만)
+    today = date.today().strftime('%Y%m%d')
 
     st.markdown("### 📦 다운로드 옵션")
 
     col1, col2 = st.columns(2)
 
-    # CSV 다운로드
+    # 데이터 다운로드 (CSV: 엑셀 호환, Parquet: 빠르고 작은 컬럼 형식)
     with col1:
-        st.markdown("#### 📄 CSV 다운로드")
+        st.markdown("#### 📄 데이터 다운로드")
 
         if analysis_type == 'ecommerce':
             clustered_df = results['clustered_df']
-            csv = clustered_df.to_csv(index=False, encoding='utf-8-sig')
+            csv = _export_file(results, 'clustered', lambda: clustered_df)
 
             st.download_button(
                 label="📊 고객 세분화 CSV 다운로드",
                 data=csv,
-                file_name=f"rfm_analysis_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                file_name=f"rfm_analysis_{today}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
+            _parquet_download_button(results, 'clustered', lambda: clustered_df,
+                                     "📊 고객 세분화 Parquet 다운로드", f"rfm_analysis_{today}.parquet")
 
             st.info(f"총 {len(clustered_df):,}개 고객 데이터")
 
@@ -2004,30 +2460,32 @@ def page_export():
             if 'rating' in analyzer.df.columns:
                 display_cols.insert(1, 'rating')
 
-            csv = analyzer.df[display_cols].to_csv(index=False, encoding='utf-8-sig')
+            csv = _export_file(results, 'review', lambda: analyzer.df[display_cols])
 
             st.download_button(
                 label="💬 리뷰 감성 분석 CSV 다운로드",
                 data=csv,
-                file_name=f"review_analysis_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                file_name=f"review_analysis_{today}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
+            _parquet_download_button(results, 'review', lambda: analyzer.df[display_cols],
+                                     "💬 리뷰 감성 분석 Parquet 다운로드", f"review_analysis_{today}.parquet")
 
-            st.info(f"총 {len(analyzer.df):,}개 리뷰")
+            st.info(f"총 {results['review_count']:,}개 리뷰")
 
         elif analysis_type == 'sales':
             daily = results['daily']
             top_products = results['top_products']
 
             # CSV 준비 (일별 + 상품 데이터)
-            csv_daily = daily.to_csv(index=False, encoding='utf-8-sig')
-            csv_products = top_products.to_csv(index=False, encoding='utf-8-sig')
+            csv_daily = _export_file(results, 'daily', lambda: daily)
+            csv_products = _export_file(results, 'top_products', lambda: top_products)
 
             st.download_button(
                 label="📊 일별 매출 CSV 다운로드",
                 data=csv_daily,
-                file_name=f"sales_daily_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                file_name=f"sales_daily_{today}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
@@ -2035,10 +2493,14 @@ def page_export():
             st.download_button(
                 label="📦 상품별 매출 CSV 다운로드",
                 data=csv_products,
-                file_name=f"sales_products_{pd.Timestamp.now().strftime('%Y%m%d')}.csv",
+                file_name=f"sales_products_{today}.csv",
                 mime="text/csv",
                 use_container_width=True
             )
+            _parquet_download_button(results, 'daily', lambda: daily,
+                                     "📊 일별 매출 Parquet 다운로드", f"sales_daily_{today}.parquet")
+            _parquet_download_button(results, 'top_products', lambda: top_products,
+                                     "📦 상품별 매출 Parquet 다운로드", f"sales_products_{today}.parquet")
 
             st.info(f"일별 데이터: {len(daily):,}일 | 상품 데이터: {len(top_products):,}개")
 
@@ -2049,8 +2511,8 @@ def page_export():
         if st.button("📑 리포트 생성", use_container_width=True):
             with st.spinner("📊 차트를 생성하고 리포트를 만드는 중..."):
                 try:
-                    generator = HTMLReportGenerator()
-                    visualizer = Visualizer() # 차트 생성을 위한 인스턴스
+                    generator = get_report_generator()
+                    visualizer = get_visualizer() # 차트 생성을 위한 인스턴스
                     
                     # [NEW] GPT 분석 내용 수집
                     gpt_content = ""
@@ -2064,13 +2526,12 @@ def page_export():
 
                     if analysis_type == 'ecommerce':
                         # E-commerce 차트 4종 재생성
-                        charts.append(visualizer.plot_rfm_heatmap(results['cluster_summary']))
-                        charts.append(visualizer.plot_cluster_bar_chart(results['cluster_summary']))
-                        charts.append(visualizer.plot_customer_value_pyramid(results['cluster_summary']))
-                        charts.append(visualizer.plot_cluster_distribution_pie(results['cluster_summary']))
+                        charts.append(_cached_chart(results, 'rfm_heatmap', lambda: visualizer.plot_rfm_heatmap(results['cluster_summary'])))
+                        charts.append(_cached_chart(results, 'cluster_bar_chart', lambda: visualizer.plot_cluster_bar_chart(results['cluster_summary'])))
+                        charts.append(_cached_chart(results, 'customer_value_pyramid', lambda: visualizer.plot_customer_value_pyramid(results['cluster_summary'])))
+                        charts.append(_cached_chart(results, 'cluster_distribution_pie', lambda: visualizer.plot_cluster_distribution_pie(results['cluster_summary'])))
 
                         # 인사이트 생성
-                        from modules.insight_generator import InsightGenerator
                         insight_gen = InsightGenerator()
                         insights = insight_gen.generate_rfm_insights(
                             results['rfm_df'],
@@ -2092,7 +2553,7 @@ def page_export():
                         st.download_button(
                             label="📥 E-commerce 리포트 다운로드",
                             data=html_report,
-                            file_name=f"ecommerce_report_{pd.Timestamp.now().strftime('%Y%m%d')}.html",
+                            file_name=f"ecommerce_report_{today}.html",
                             mime="text/html",
                             use_container_width=True
                         )
@@ -2101,17 +2562,19 @@ def page_export():
                         analyzer = results['analyzer']
                         
                         # 리뷰 차트 재생성
-                        charts.append(visualizer.plot_sentiment_distribution(analyzer.df))
+                        charts.append(_cached_chart(results, 'sentiment_distribution',
+                                                    lambda: visualizer.plot_sentiment_distribution(analyzer.df)))
                         
                         keywords = results.get('keywords', {})
                         if keywords:
-                            charts.append(visualizer.plot_keywords_comparison(keywords))
+                            charts.append(_cached_chart(results, 'keywords_comparison',
+                                                        lambda: visualizer.plot_keywords_comparison(keywords)))
 
                         # 워드클라우드 데이터가 있다면 (이건 이미지라 복잡할 수 있어 일단 생략하거나 빈도수 차트로 대체)
                         # 여기서는 감성 분포와 키워드 차트 2개만 넣음
 
-                        sentiment_counts = analyzer.df['sentiment'].value_counts().to_dict()
-                        total = len(analyzer.df)
+                        sentiment_counts = results['sentiment_counts']
+                        total = results['review_count']
                         positive_pct = (sentiment_counts.get('positive', 0) / total * 100) if total > 0 else 0
                         negative_pct = (sentiment_counts.get('negative', 0) / total * 100) if total > 0 else 0
 
@@ -2134,7 +2597,7 @@ def page_export():
                         html_report = generator.generate_report(
                             analysis_type='review',
                             data_info={
-                                'rows': len(analyzer.df),
+                                'rows': results['review_count'],
                                 'columns': len(analyzer.df.columns)
                             },
                             insights=insights,
@@ -2145,7 +2608,7 @@ def page_export():
                         st.download_button(
                             label="📥 리뷰 분석 리포트 다운로드",
                             data=html_report,
-                            file_name=f"review_report_{pd.Timestamp.now().strftime('%Y%m%d')}.html",
+                            file_name=f"review_report_{today}.html",
                             mime="text/html",
                             use_container_width=True
                         )
@@ -2157,27 +2620,27 @@ def page_export():
                         pareto_df = results['pareto_df']
 
                         # 이동평균 컬럼 찾기
-                        ma_cols = [col for col in daily.columns if 'ma_' in col]
+                        ma_cols = results['ma_columns']['daily']
 
-                        charts.append(visualizer.plot_sales_trend(
+                        charts.append(_cached_chart(results, 'report_sales_trend', lambda: visualizer.plot_sales_trend(
                             daily,
                             date_column='date',
                             sales_column='sales',
                             ma_columns=ma_cols if ma_cols else None,
                             title='일별 매출 트렌드',
                             currency='원'
-                        ))
+                        )))
 
-                        charts.append(visualizer.plot_top_products_bar(
+                        charts.append(_cached_chart(results, 'top_products_bar', lambda: visualizer.plot_top_products_bar(
                             top_products,
                             product_column='product',
                             sales_column='sales',
                             top_n=20,
                             title='상품별 매출 순위 TOP 20',
                             currency='원'
-                        ))
+                        )))
 
-                        charts.append(visualizer.plot_pareto_chart(
+                        charts.append(_cached_chart(results, 'pareto_chart', lambda: visualizer.plot_pareto_chart(
                             pareto_df,
                             product_column='product',
                             sales_column='sales',
@@ -2186,12 +2649,14 @@ def page_export():
                             threshold=80.0,
                             title='파레토 분석 - 매출 기여도',
                             currency='원'
-                        ))
+                        )))
 
                         # 인사이트 생성
                         pareto_summary = results['pareto_summary']
-                        total_sales = daily['sales'].sum()
-                        avg_sales = daily['sales'].mean()
+                        # 분석 시 미리 계산한 일별 매출 합계/평균 재사용
+                        daily_stats = results['period_stats']['daily']
+                        total_sales = daily_stats['sum']
+                        avg_sales = daily_stats['mean']
 
                         insights = {
                             'key_findings': [
@@ -2222,7 +2687,7 @@ def page_export():
                         st.download_button(
                             label="📥 판매 분석 리포트 다운로드",
                             data=html_report,
-                            file_name=f"sales_report_{pd.Timestamp.now().strftime('%Y%m%d')}.html",
+                            file_name=f"sales_report_{today}.html",
                             mime="text/html",
                             use_container_width=True
                         )
@@ -2231,7 +2696,10 @@ def page_export():
 
                 except Exception as e:
                     st.error(f"❌ 리포트 생성 실패: {str(e)}")
-                    st.exception(e)
+                    logger.exception("리포트 생성 실패")
+                    # 상세 traceback 화면 출력은 로컬 디버깅에서만
+                    if Environment.is_local():
+                        st.exception(e)
 
 # ==================== 메인 ====================
 
@@ -9,8 +9,11 @@ Naver Movie Review Crawler
 import argparse
 import time
 import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
@@ -23,6 +26,13 @@ from pathlib import Path
 
 class NaverMovieCrawler:
     """네이버 영화 리뷰 크롤러"""
+
+    BASE_URL = "https://movie.naver.com/movie/bi/mi/pointWriteFormList.nhn?code={movie_id}&type=after&page={page}"
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+    # HTTP 요청 재시도 설정
+    MAX_RETRIES = 3
+    RETRY_DELAY = 1.0  # 초 (재시도마다 2배)
     
     def __init__(self, headless: bool = True, delay: float = 1.0):
         """
@@ -32,21 +42,29 @@ class NaverMovieCrawler:
         """
         self.delay = delay
         self.reviews = []
+        # 요청 실패로 목표 수보다 적게 수집하고 중단했는지 여부 (병렬 크롤링)
+        self.truncated = False
         
         # Chrome 옵션 설정
-        chrome_options = Options()
+        self.chrome_options = Options()
         if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+            self.chrome_options.add_argument('--headless')
+        self.chrome_options.add_argument('--no-sandbox')
+        self.chrome_options.add_argument('--disable-dev-shm-usage')
+        self.chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        self.chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
         
-        # WebDriver 초기화
-        self.driver = webdriver.Chrome(
-            service=Service(ChromeDriverManager().install()),
-            options=chrome_options
-        )
+        # WebDriver는 브라우저 크롤링이 필요할 때 생성 (HTTP 수집만 하면 Chrome을 띄우지 않음)
+        self.driver = None
+
+    def _get_driver(self):
+        """WebDriver 초기화 (처음 사용할 때 한 번만)"""
+        if self.driver is None:
+            self.driver = webdriver.Chrome(
+                service=Service(ChromeDriverManager().install()),
+                options=self.chrome_options
+            )
+        return self.driver
     
     def crawl_reviews(self, movie_id: str, max_reviews: int = 100) -> pd.DataFrame:
         """
@@ -59,76 +77,46 @@ class NaverMovieCrawler:
         Returns:
             pd.DataFrame: 리뷰 데이터프레임
         """
-        base_url = f"https://movie.naver.com/movie/bi/mi/pointWriteFormList.nhn?code={movie_id}&type=after&page="
+        # 크롤러 인스턴스를 재사용할 수 있도록 이전 수집 결과 초기화
+        self.reviews = []
         
         print(f"🎬 영화 ID {movie_id}의 리뷰 크롤링 시작...")
         print(f"목표: {max_reviews}개 리뷰 수집")
         
-        page = 1
-        pbar = tqdm(total=max_reviews, desc="리뷰 수집 중")
+        self._crawl_pages_with_browser(movie_id, 1, max_reviews)
+        
+        # DataFrame 변환
+        df = pd.DataFrame(self.reviews)
+        print(f"\n✅ 크롤링 완료! 총 {len(df)}개 리뷰 수집")
+        
+        return df
+
+    def _crawl_pages_with_browser(self, movie_id: str, start_page: int, max_reviews: int):
+        """브라우저로 start_page부터 차례로 수집하여 self.reviews에 추가"""
+        base_url = f"https://movie.naver.com/movie/bi/mi/pointWriteFormList.nhn?code={movie_id}&type=after&page="
+        driver = self._get_driver()
+
+        page = start_page
+        pbar = tqdm(total=max_reviews, initial=len(self.reviews), desc="리뷰 수집 중")
         
         while len(self.reviews) < max_reviews:
             try:
                 # 페이지 로드
                 url = base_url + str(page)
-                self.driver.get(url)
+                driver.get(url)
                 time.sleep(self.delay)
                 
-                # 리뷰 요소 찾기
-                review_elements = self.driver.find_elements(By.CSS_SELECTOR, '.score_result li')
-                
-                if not review_elements:
+                # 렌더링된 HTML을 한 번만 가져와 파싱 (리뷰 필드마다 WebDriver 요청하지 않음)
+                page_reviews = self._parse_page(driver.page_source, movie_id)
+
+                if not page_reviews:
                     print(f"\n더 이상 리뷰가 없습니다. (페이지 {page})")
                     break
-                
-                # 각 리뷰 파싱
-                for element in review_elements:
-                    if len(self.reviews) >= max_reviews:
-                        break
-                    
-                    try:
-                        # 평점
-                        score_elem = element.find_element(By.CSS_SELECTOR, '.star_score em')
-                        score = int(score_elem.text)
-                        
-                        # 리뷰 텍스트
-                        review_elem = element.find_element(By.CSS_SELECTOR, '.score_reple p')
-                        review_text = review_elem.text.strip()
-                        
-                        # 작성자
-                        author_elem = element.find_element(By.CSS_SELECTOR, '.score_reple a')
-                        author = author_elem.text.strip()
-                        
-                        # 작성일
-                        date_elem = element.find_element(By.CSS_SELECTOR, '.score_reple em:nth-of-type(2)')
-                        date = date_elem.text.strip()
-                        
-                        # 공감 수
-                        like_elem = element.find_element(By.CSS_SELECTOR, '.sympathy_button')
-                        like_text = like_elem.text.replace('공감', '').strip()
-                        likes = int(like_text) if like_text else 0
-                        
-                        self.reviews.append({
-                            'movie_id': movie_id,
-                            'author': author,
-                            'score': score,
-                            'review': review_text,
-                            'date': date,
-                            'likes': likes,
-                            'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                        })
-                        
-                        pbar.update(1)
-
-                    except (ValueError, AttributeError) as e:
-                        # 개별 리뷰 파싱 실패는 무시 (예상 가능한 에러만)
-                        continue
-                    except Exception as e:
-                        # 예상치 못한 에러는 경고 출력
-                        import warnings
-                        warnings.warn(f"리뷰 파싱 중 예상치 못한 에러: {str(e)[:100]}")
-                        continue
-                
+
+                page_reviews = page_reviews[:max_reviews - len(self.reviews)]
+                self.reviews.extend(page_reviews)
+                pbar.update(len(page_reviews))
+
                 page += 1
                 
             except Exception as e:
@@ -136,17 +124,135 @@ class NaverMovieCrawler:
                 break
         
         pbar.close()
-        
-        # DataFrame 변환
+    
+    def crawl_reviews_concurrent(self, movie_id: str, max_reviews: int = 100,
+                                 max_workers: int = 8) -> pd.DataFrame:
+        """
+        영화 리뷰 병렬 크롤링 (HTTP + 스레드 풀)
+
+        리뷰 목록 페이지는 정적 HTML이므로 브라우저 대신 requests로
+        여러 페이지를 동시에 요청하여 네트워크 대기 시간을 겹친다.
+        HTML 파싱도 각 작업 스레드 안에서 수행하므로 한 페이지를 파싱하는
+        동안 다른 페이지 요청이 계속 진행된다.
+
+        Args:
+            movie_id: 네이버 영화 ID
+            max_reviews: 수집할 최대 리뷰 수
+            max_workers: 동시 요청 수 (Rate Limit 방지를 위해 제한)
+
+        Returns:
+            pd.DataFrame: 리뷰 데이터프레임 (재시도 후에도 실패한 페이지부터는 브라우저로 수집)
+        """
+        self.reviews = []
+        self.truncated = False
+
+        print(f"🎬 영화 ID {movie_id}의 리뷰 병렬 크롤링 시작... (동시 요청 {max_workers}개)")
+
+        page = 1
+        exhausted = False
+        failed_page = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not exhausted and len(self.reviews) < max_reviews:
+                pages = range(page, page + max_workers)
+                # executor.map은 페이지 순서를 보존
+                for page_num, page_reviews in zip(pages, executor.map(
+                        lambda p: self._fetch_page(movie_id, p), pages)):
+                    if page_reviews is None:
+                        # 재시도 후에도 실패한 페이지부터는 브라우저로 이어서 수집
+                        failed_page = page_num
+                        exhausted = True
+                        break
+                    if not page_reviews:
+                        print(f"\n더 이상 리뷰가 없습니다. (페이지 {page_num})")
+                        exhausted = True
+                        break
+                    self.reviews.extend(page_reviews)
+
+                page += max_workers
+                # 다음 요청 묶음이 있을 때만 대기
+                if not exhausted and len(self.reviews) < max_reviews:
+                    time.sleep(self.delay)
+
+        del self.reviews[max_reviews:]
+        if failed_page is not None and len(self.reviews) < max_reviews:
+            print(f"\n⚠️  페이지 {failed_page}부터 브라우저 크롤링으로 대체")
+            try:
+                self._crawl_pages_with_browser(movie_id, failed_page, max_reviews)
+            except Exception as e:
+                # 브라우저를 띄울 수 없으면 지금까지 수집한 리뷰만 반환하고 중단 여부를 표시
+                print(f"\n⚠️  브라우저 크롤링 실패: {str(e)}")
+                self.truncated = True
+
         df = pd.DataFrame(self.reviews)
         print(f"\n✅ 크롤링 완료! 총 {len(df)}개 리뷰 수집")
-        
+
         return df
-    
+
+    def _fetch_page(self, movie_id: str, page: int) -> Optional[List[Dict]]:
+        """
+        리뷰 목록 한 페이지 요청 및 파싱 (스레드 풀에서 호출)
+
+        Returns:
+            리뷰 리스트 (빈 리스트는 더 이상 리뷰가 없음을 의미),
+            재시도 후에도 요청이 실패하면 None
+        """
+        url = self.BASE_URL.format(movie_id=movie_id, page=page)
+        delay = self.RETRY_DELAY
+
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            try:
+                response = requests.get(url, headers={'User-Agent': self.USER_AGENT}, timeout=10)
+                response.raise_for_status()
+                return self._parse_page(response.text, movie_id)
+            except requests.RequestException as e:
+                status = e.response.status_code if e.response is not None else None
+                # 429(Rate Limit), 5xx, 연결/타임아웃 오류만 재시도
+                retryable = status is None or status == 429 or status >= 500
+                print(f"\n⚠️  페이지 {page} 로드 실패 ({attempt}/{self.MAX_RETRIES}): {str(e)}")
+                if not retryable or attempt == self.MAX_RETRIES:
+                    return None
+                time.sleep(delay)
+                delay *= 2
+
+        return None
+
+    def _parse_page(self, html: str, movie_id: str) -> List[Dict]:
+        """리뷰 목록 HTML 파싱"""
+        soup = BeautifulSoup(html, 'lxml')
+        reviews = []
+
+        for element in soup.select('.score_result li'):
+            try:
+                score = int(element.select_one('.star_score em').get_text(strip=True))
+                review_text = element.select_one('.score_reple p').get_text(strip=True)
+                author = element.select_one('.score_reple a').get_text(strip=True)
+                date = element.select_one('.score_reple em:nth-of-type(2)').get_text(strip=True)
+                like_text = element.select_one('.sympathy_button').get_text(strip=True).replace('공감', '').strip()
+                likes = int(like_text) if like_text else 0
+            except (ValueError, AttributeError):
+                # 개별 리뷰 파싱 실패는 무시
+                continue
+
+            reviews.append({
+                'movie_id': movie_id,
+                'author': author,
+                'score': score,
+                'review': review_text,
+                'date': date,
+                'likes': likes,
+                'crawled_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            })
+
+        return reviews
+
     def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (여러 번 호출해도 한 번만 종료)"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
 
 
 def main():
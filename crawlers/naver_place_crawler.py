@@ -67,6 +67,9 @@ class NaverPlaceCrawler:
             f"https://pcmap.place.naver.com/restaurant/{place_id}/review/visitor",
         ]
 
+        # 크롤러 인스턴스를 재사용할 수 있도록 이전 수집 결과 초기화
+        self.reviews = []
+
         print(f"🏪 플레이스 ID {place_id}의 리뷰 크롤링 시작...")
         print(f"목표: {max_reviews}개 리뷰 수집")
 
@@ -404,9 +407,12 @@ class NaverPlaceCrawler:
         return "방문"  # 기본값
 
     def close(self):
-        """브라우저 종료"""
+        """브라우저 종료 (여러 번 호출해도 한 번만 종료)"""
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
 
 
 def main():
@@ -52,6 +52,13 @@ class DataLoader:
             result = chardet.detect(f.read(10000))
             encoding = result['encoding']
         
+        # UTF-8 계열이면 PyArrow 멀티스레드 파서 우선 사용 (CP949 등은 지원하지 않음)
+        if encoding and encoding.lower() in ('utf-8', 'utf-8-sig', 'ascii'):
+            try:
+                return pd.read_csv(file_path, engine='pyarrow')
+            except (ValueError, ImportError):
+                pass
+
         # CSV 읽기 시도
         try:
             df = pd.read_csv(file_path, encoding=encoding)
@@ -101,7 +108,7 @@ class DataLoader:
         # 날짜 컬럼 감지
         date_columns = []
         for col in df.columns:
-            if df[col].dtype == 'object':
+            if df[col].dtype == 'object' or isinstance(df[col].dtype, pd.CategoricalDtype):
                 # 샘플링하여 날짜 형식 확인
                 sample = df[col].dropna().head(100)
                 try:
@@ -13,6 +13,8 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 import logging
 
+from utils.dtypes import upcast_numeric
+
 logger = logging.getLogger(__name__)
 
 
@@ -337,7 +339,7 @@ class DatabaseManager:
                 raise ValueError(f"Missing required column: {col}")
 
         # revenue 계산
-        df['revenue'] = df['quantity'] * df['price']
+        df['revenue'] = upcast_numeric(df['quantity']) * upcast_numeric(df['price'])  # int32 곱셈 오버플로 방지
 
         # 선택 컬럼 기본값
         if 'category' not in df.columns:
@@ -5,12 +5,19 @@ DAY 27: 부정 리뷰 필터링 + Rate Limit 핸들링 추가
 """
 
 import pandas as pd
+import numpy as np
 import json
+import random
 import time
 import logging
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import os
 
+from utils.gpt_cache import SentimentCache
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -30,6 +37,10 @@ class GPTAnalyzer:
     INITIAL_DELAY = 1.0  # 초
     MAX_DELAY = 60.0  # 최대 60초
     BATCH_DELAY = 0.5  # 배치 간 딜레이
+    MAX_CONCURRENT_BATCHES = 5  # 동시 요청 배치 수 (Rate Limit 고려)
+
+    # 감성 분석 실패 시 기본값
+    FAILED_SENTIMENT = {"sentiment": "neutral", "confidence": 0.5, "reason": "분석 실패"}
 
     # 모델별 가격 (2025년 1월 기준, USD per 1M tokens)
     # 출처: https://openai.com/pricing
@@ -41,11 +52,12 @@ class GPTAnalyzer:
         'gpt-3.5-turbo': {'input': 0.50, 'output': 1.50},
     }
 
-    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini"):
+    def __init__(self, api_key: str = None, model: str = "gpt-4o-mini", use_cache: bool = True):
         """
         Args:
             api_key: OpenAI API 키 (None이면 환경변수에서 가져옴)
             model: 사용할 모델 (gpt-4o-mini 권장 - 저렴하고 빠름)
+            use_cache: 리뷰별 감성 분석 결과 디스크 캐시 사용 여부
         """
         if not OPENAI_AVAILABLE:
             raise ImportError("openai 패키지를 설치하세요: pip install openai")
@@ -58,6 +70,12 @@ class GPTAnalyzer:
         self.client = openai.OpenAI(api_key=self.api_key)
         self.total_tokens = 0
         self.total_cost = 0.0
+        self._usage_lock = threading.Lock()
+
+        # 감성 분석 캐시는 analyze_sentiment_batch 호출 동안만 연결
+        # (전략/인사이트 생성만 하는 인스턴스는 SQLite 연결을 열지 않음)
+        self.use_cache = use_cache
+        self.cache = None
 
         # 모델별 가격 설정
         if model in self.PRICING:
@@ -87,13 +105,14 @@ class GPTAnalyzer:
             try:
                 response = func(*args, **kwargs)
 
-                # 토큰 사용량 추적
+                # 토큰 사용량 추적 (동시 배치 요청 시 스레드 간 공유)
                 if hasattr(response, 'usage'):
-                    self.total_tokens += response.usage.total_tokens
                     # 모델별 가격 적용
                     input_cost = (response.usage.prompt_tokens / 1_000_000) * self.input_price
                     output_cost = (response.usage.completion_tokens / 1_000_000) * self.output_price
-                    self.total_cost += (input_cost + output_cost)
+                    with self._usage_lock:
+                        self.total_tokens += response.usage.total_tokens
+                        self.total_cost += (input_cost + output_cost)
 
                 return response
 
@@ -148,11 +167,41 @@ class GPTAnalyzer:
             logger.error(f"텍스트 컬럼 '{text_column}' 없음")
             return []
 
+    @staticmethod
+    def select_reanalysis_positions(sentiments, max_reviews: int = 500, min_targets: int = 10,
+                                    rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        GPT 재분석 대상 행 위치 선정 (부정/중립 우선)
+
+        Args:
+            sentiments: 기본 감성 분석 결과 (positive/negative/neutral, 결측 가능)
+            max_reviews: 최대 재분석 건수 (비용 관리)
+            min_targets: 부정/중립이 이보다 적으면 전체 행에서 샘플링
+            rng: 샘플링용 난수 생성기 (None이면 새로 생성)
+
+        Returns:
+            재분석할 행의 위치 인덱스 배열
+        """
+        sentiments = pd.Series(sentiments)
+        # 결측 감성은 부정/중립으로 취급하지 않음 (!= 'positive' 비교는 NaN도 선택함)
+        target_positions = np.flatnonzero(sentiments.isin(['negative', 'neutral']).to_numpy())
+
+        # 대상이 너무 적으면 전체에서 샘플링
+        if target_positions.size < min_targets:
+            target_positions = np.arange(len(sentiments))
+
+        if target_positions.size > max_reviews:
+            rng = rng if rng is not None else np.random.default_rng()
+            target_positions = rng.choice(target_positions, max_reviews, replace=False)
+
+        return target_positions
+
     def analyze_sentiment_batch(self, reviews: List[str], max_reviews: int = 100,
                                 filter_negative: bool = False,
                                 df: Optional[pd.DataFrame] = None,
                                 rating_column: str = 'rating',
-                                text_column: str = 'review_text') -> List[Dict]:
+                                text_column: str = 'review_text',
+                                max_workers: int = 1) -> List[Dict]:
         """
         리뷰 감성을 GPT로 재분석 (문맥 이해)
 
@@ -163,6 +212,7 @@ class GPTAnalyzer:
             df: DataFrame (filter_negative=True일 때 필수)
             rating_column: 평점 컬럼명 (filter_negative=True일 때 사용)
             text_column: 리뷰 텍스트 컬럼명 (filter_negative=True일 때 사용)
+            max_workers: 동시 요청 배치 수 (1이면 배치 간 딜레이를 두고 순차 처리)
 
         Returns:
             감성 분석 결과 리스트
@@ -186,23 +236,89 @@ class GPTAnalyzer:
 
         # 샘플링 (너무 많으면 비용 증가)
         if len(reviews) > max_reviews:
-            import random
             reviews = random.sample(reviews, max_reviews)
             logger.info(f"리뷰 샘플링: {len(reviews)}개")
         
-        results = []
+        # 주입된 캐시가 없으면 이번 호출 동안만 캐시 연결을 열고 닫음
+        cache = self.cache if self.cache is not None else self._open_cache()
+        try:
+            return self._analyze_sentiment_reviews(reviews, max_workers, cache)
+        finally:
+            if cache is not None and cache is not self.cache:
+                cache.close()
+
+    def _open_cache(self) -> Optional[SentimentCache]:
+        """감성 분석 캐시 연결 (파일 시스템에 쓸 수 없는 환경에서는 None - 캐시 없이 동작)"""
+        if not self.use_cache:
+            return None
+        try:
+            return SentimentCache()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"감성 분석 캐시를 사용할 수 없습니다: {str(e)}")
+            return None
+
+    def _analyze_sentiment_reviews(self, reviews: List[str], max_workers: int,
+                                   cache: Optional[SentimentCache]) -> List[Dict]:
+        """캐시 조회 후 나머지 리뷰만 배치로 GPT 분석 (cache가 None이면 캐시 없이)"""
+        # 이미 분석한 리뷰는 캐시 결과를 사용하고 나머지만 API 호출
+        keys = [SentimentCache.make_key(self.model, review) for review in reviews] if cache else []
+        cached = cache.get_many(keys) if cache else {}
+        if cached:
+            logger.info(f"캐시 적중: {len(cached)}/{len(reviews)}개")
+        pending = [i for i in range(len(reviews)) if not cached or keys[i] not in cached]
+        pending_reviews = [reviews[i] for i in pending]
 
         # 배치로 묶어서 처리 (10개씩)
         batch_size = 10
-        total_batches = (len(reviews) + batch_size - 1) // batch_size
+        batches = [pending_reviews[i:i+batch_size] for i in range(0, len(pending_reviews), batch_size)]
+        total_batches = len(batches)
+
+        if max_workers > 1:
+            # 배치 요청을 동시에 보내 API 응답 대기 시간을 겹침 (순서는 executor.map이 보존)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batch_outputs = list(executor.map(
+                    lambda args: self._analyze_sentiment_chunk(*args, total_batches),
+                    enumerate(batches, start=1)))
+        else:
+            batch_outputs = []
+            for batch_num, batch in enumerate(batches, start=1):
+                batch_outputs.append(self._analyze_sentiment_chunk(batch_num, batch, total_batches))
+
+                # 배치 간 딜레이 (Rate Limit 방지)
+                if batch_num < total_batches:
+                    time.sleep(self.BATCH_DELAY)
+
+        fresh = []
+        new_entries = []
+        for batch_idx, (batch, batch_results) in enumerate(zip(batches, batch_outputs)):
+            if batch_results is None:
+                # 오류 시 기본값 (캐시에 저장하지 않음)
+                batch_results = [dict(self.FAILED_SENTIMENT) for _ in batch]
+            elif cache and len(batch_results) == len(batch):
+                # 응답 개수가 리뷰 개수와 일치할 때만 리뷰별로 저장
+                batch_keys = [keys[i] for i in pending[batch_idx * batch_size:(batch_idx + 1) * batch_size]]
+                new_entries.extend(zip(batch_keys, batch_results))
+            fresh.extend(batch_results)
+
+        if new_entries:
+            cache.set_many(new_entries)
+
+        if cached:
+            fresh_iter = iter(fresh)
+            results = [cached[key] if key in cached else next(fresh_iter, dict(self.FAILED_SENTIMENT))
+                       for key in keys]
+        else:
+            results = fresh
 
-        for i in range(0, len(reviews), batch_size):
-            batch = reviews[i:i+batch_size]
-            batch_num = i // batch_size + 1
+        logger.info(f"감성 분석 완료: {len(results)}개 리뷰, 비용: ${self.total_cost:.4f}, 토큰: {self.total_tokens}")
+        return results
 
-            logger.debug(f"배치 {batch_num}/{total_batches} 처리 중...")
+    def _analyze_sentiment_chunk(self, batch_num: int, batch: List[str],
+                                 total_batches: int) -> Optional[List[Dict]]:
+        """리뷰 한 배치의 감성 분석 (실패 시 None)"""
+        logger.debug(f"배치 {batch_num}/{total_batches} 처리 중...")
 
-            prompt = f"""다음 리뷰들의 감성을 분석해주세요. 각 리뷰에 대해 JSON 형식으로 답변하세요.
+        prompt = f"""다음 리뷰들의 감성을 분석해주세요. 각 리뷰에 대해 JSON 형식으로 답변하세요.
 
 리뷰들:
 {json.dumps(batch, ensure_ascii=False)}
@@ -220,37 +336,28 @@ class GPTAnalyzer:
 
 문맥을 정확히 이해하세요. 예: "별로 나쁘지 않다" = neutral/positive"""
 
-            try:
-                # Retry 래퍼로 API 호출
-                response = self._call_with_retry(
-                    self.client.chat.completions.create,
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": "당신은 한국어 리뷰 감성 분석 전문가입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    response_format={"type": "json_object"},
-                    temperature=0.3
-                )
+        try:
+            # Retry 래퍼로 API 호출
+            response = self._call_with_retry(
+                self.client.chat.completions.create,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": "당신은 한국어 리뷰 감성 분석 전문가입니다."},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.3
+            )
 
-                batch_results = json.loads(response.choices[0].message.content)
-                results.extend(batch_results.get('results', []))
+            batch_results = json.loads(response.choices[0].message.content)
+            return batch_results.get('results', [])
 
-                # 배치 간 딜레이 (Rate Limit 방지)
-                if i + batch_size < len(reviews):
-                    time.sleep(self.BATCH_DELAY)
-                
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.error(f"GPT 응답 파싱 오류 (배치 {batch_num}/{total_batches}): {str(e)}")
-                # 오류 시 기본값
-                results.extend([{"sentiment": "neutral", "confidence": 0.5, "reason": "분석 실패"}] * len(batch))
-            except Exception as e:
-                logger.error(f"GPT 분석 오류 (배치 {batch_num}/{total_batches}): {str(e)}")
-                # 오류 시 기본값
-                results.extend([{"sentiment": "neutral", "confidence": 0.5, "reason": "분석 실패"}] * len(batch))
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.error(f"GPT 응답 파싱 오류 (배치 {batch_num}/{total_batches}): {str(e)}")
+        except Exception as e:
+            logger.error(f"GPT 분석 오류 (배치 {batch_num}/{total_batches}): {str(e)}")
 
-        logger.info(f"감성 분석 완료: {len(results)}개 리뷰, 비용: ${self.total_cost:.4f}, 토큰: {self.total_tokens}")
-        return results
+        return None
 
     def get_cost_info(self) -> Dict[str, float]:
         """
@@ -284,7 +391,6 @@ class GPTAnalyzer:
         # Generating summary with GPT
         
         if len(reviews) > max_reviews:
-            import random
             reviews = random.sample(reviews, max_reviews)
         
         reviews_text = "\n".join([f"- {r}" for r in reviews[:50]])
@@ -333,7 +439,6 @@ class GPTAnalyzer:
         # Detecting issues with GPT
         
         if len(reviews) > max_reviews:
-            import random
             reviews = random.sample(reviews, max_reviews)
         
         reviews_text = "\n".join([f"- {r}" for r in reviews[:50]])
@@ -399,7 +504,6 @@ class GPTAnalyzer:
         # Categorizing reviews with GPT
         
         if len(reviews) > max_reviews:
-            import random
             reviews = random.sample(reviews, max_reviews)
         
         reviews_text = "\n".join([f"- {r}" for r in reviews[:50]])
@@ -456,7 +560,6 @@ class GPTAnalyzer:
         # Generating advanced insights with GPT
         
         if len(reviews) > max_reviews:
-            import random
             reviews = random.sample(reviews, max_reviews)
         
         reviews_text = "\n".join([f"- {r}" for r in reviews[:30]])
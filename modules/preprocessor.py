@@ -225,6 +225,36 @@ class DataPreprocessor:
 
         return self
     
+    def clean_for_analysis(self, date_columns: List[str]) -> 'DataPreprocessor':
+        """
+        컬럼명 정규화 + 결측치 행 삭제 + 중복 제거 + 날짜 변환을 한 번에 수행
+
+        normalize_column_names().handle_missing_values('drop').remove_duplicates()
+        .convert_date_columns()와 결과가 같지만, 결측/중복 마스크를 합쳐
+        행 필터링 복사를 한 번만 수행한다.
+
+        Args:
+            date_columns: 날짜 컬럼 리스트 (정규화된 컬럼명 기준)
+
+        Returns:
+            self
+        """
+        self.normalize_column_names()
+
+        not_null = self.df.notna().all(axis=1)
+        initial_missing = self.df.isnull().sum().sum()
+        # 결측 행은 어차피 삭제되므로 중복 판단을 함께 해도 결과가 같음
+        duplicated = self.df.duplicated() & not_null
+        self.df = self.df[not_null & ~duplicated]
+
+        self.preprocessing_log.append(
+            f"✅ 결측치 처리: {initial_missing}개 → 0개"
+        )
+        if duplicated.sum() > 0:
+            self.preprocessing_log.append(f"✅ 중복 행 제거: {duplicated.sum()}개")
+
+        return self.convert_date_columns(date_columns)
+
     def filter_by_condition(self, condition: str) -> 'DataPreprocessor':
         """
         조건에 따라 데이터 필터링
@@ -11,9 +11,17 @@ from sklearn.metrics import silhouette_score
 from datetime import datetime, timedelta
 from typing import Tuple, Dict
 
+from utils.dtypes import upcast_numeric
+
 
 class RFMAnalyzer:
     """RFM 분석 및 K-Means 군집화"""
+
+    # 세그먼트 분류용 군집 이름 키워드
+    SEGMENT_KEYWORDS = {
+        'vip': ('VIP', '충성'),
+        'risk': ('이탈', '휴면'),
+    }
     
     def __init__(self, df: pd.DataFrame, 
                  customer_col: str = 'CustomerID',
@@ -51,7 +59,9 @@ class RFMAnalyzer:
                 if 'totalamount' in self.df.columns:
                     import warnings
                     warnings.warn("기존 'totalamount' 컬럼이 덮어씌워집니다. 명시적으로 amount_col을 지정하세요.")
-                self.df['totalamount'] = self.df[quantity_col] * self.df[price_col]
+                # int32로 다운캐스팅된 컬럼의 곱셈 오버플로 방지를 위해 64비트로 계산
+                self.df['totalamount'] = (upcast_numeric(self.df[quantity_col])
+                                          * upcast_numeric(self.df[price_col]))
                 self.amount_col = 'totalamount'
             else:
                 raise ValueError(f"금액 컬럼이 없으며, {quantity_col}와 {price_col}도 없습니다.")
@@ -75,7 +85,7 @@ class RFMAnalyzer:
             reference_date = self.df[self.date_col].max() + timedelta(days=1)
         
         # 고객별 RFM 계산
-        rfm = self.df.groupby(self.customer_col).agg({
+        rfm = self.df.groupby(self.customer_col, observed=True).agg({
             self.date_col: lambda x: (reference_date - x.max()).days,  # Recency
             self.customer_col: 'count',  # Frequency (거래 건수)
             self.amount_col: 'sum'  # Monetary
@@ -240,6 +250,29 @@ class RFMAnalyzer:
         
         return names
     
+    def get_segment_counts(self) -> Dict[str, int]:
+        """
+        세그먼트별 고객 수 (VIP/충성, 이탈/휴면)
+
+        고객 행마다 군집 이름 문자열을 검사하지 않고,
+        군집 번호별 고객 수를 센 뒤 군집 이름(k개)만 키워드로 분류
+
+        Returns:
+            dict: {'vip': VIP/충성 고객 수, 'risk': 이탈/휴면 고객 수}
+        """
+        if self.clustered_df is None:
+            raise ValueError("먼저 perform_clustering()을 실행하세요.")
+
+        cluster_sizes = self.clustered_df['cluster'].value_counts()
+
+        counts = {}
+        for segment, keywords in self.SEGMENT_KEYWORDS.items():
+            clusters = [cluster_id for cluster_id, name in self.cluster_names.items()
+                        if any(keyword in name for keyword in keywords)]
+            counts[segment] = int(cluster_sizes.reindex(clusters, fill_value=0).sum())
+
+        return counts
+
     def get_cluster_summary(self) -> pd.DataFrame:
         """군집별 통계 요약"""
         if self.clustered_df is None:
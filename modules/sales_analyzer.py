@@ -9,6 +9,8 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 import logging
 
+from utils.dtypes import upcast_numeric
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,8 +59,9 @@ class SalesAnalyzer:
                     f"사용 가능한 컬럼: {list(self.df.columns)}"
                 )
 
-            # 매출 계산
-            self.df[sales_column] = self.df[quantity_column] * self.df[price_column]
+            # 매출 계산 (int32로 다운캐스팅된 컬럼의 곱셈 오버플로 방지를 위해 64비트로 계산)
+            self.df[sales_column] = (upcast_numeric(self.df[quantity_column])
+                                     * upcast_numeric(self.df[price_column]))
             logger.info(f"매출 컬럼 생성: {sales_column} = {quantity_column} × {price_column}")
         else:
             logger.info(f"기존 매출 컬럼 사용: {sales_column}")
@@ -176,6 +179,33 @@ class SalesAnalyzer:
         logger.info(f"집계 완료: {len(aggregated)}개 기간")
         return aggregated
 
+    def aggregate_by_periods(self, periods: List[str] = ['D', 'W', 'M']) -> Dict[str, pd.DataFrame]:
+        """
+        여러 기간 매출 집계를 한 번에 수행
+
+        원본 거래 데이터는 일별로 한 번만 집계하고,
+        주별/월별 등은 일별 집계 결과를 다시 리샘플링하여 계산
+        (aggregate_by_period를 기간마다 호출하는 것과 결과 동일)
+
+        Args:
+            periods: 집계 기간 리스트 ('D', 'W', 'M', 'Q', 'Y')
+
+        Returns:
+            {기간: 집계된 데이터프레임}
+        """
+        daily = self.aggregate_by_period('D')
+        daily_indexed = daily.set_index('date')
+
+        results = {}
+        for period in periods:
+            if period == 'D':
+                results[period] = daily
+            else:
+                results[period] = daily_indexed.resample(period).sum().reset_index()
+                logger.info(f"집계 완료 (일별 집계 기반): {period} {len(results[period])}개 기간")
+
+        return results
+
     def calculate_moving_average(self, df: pd.DataFrame,
                                  column: str = 'sales',
                                  windows: List[int] = [7, 30]) -> pd.DataFrame:
@@ -238,18 +268,20 @@ class SalesAnalyzer:
             df_result[f'{column}_growth_abs'] = np.nan
             return df_result
 
-        # 이전 기간 값
-        prev_value = df_result[column].shift(shift_periods)
+        # 이전 기간 값 (float64 배열로 한 번만 추출)
+        values = df_result[column].to_numpy(dtype=np.float64)
+        prev_value = df_result[column].shift(shift_periods).to_numpy(dtype=np.float64)
 
         # 절대 성장량
-        df_result[f'{column}_growth_abs'] = df_result[column] - prev_value
+        growth_abs = values - prev_value
+        df_result[f'{column}_growth_abs'] = growth_abs
 
         # ========== Critical Fix #4: ZeroDivision 방어 ==========
         # 성장률 계산 (이전 값이 0이면 NaN)
         with np.errstate(divide='ignore', invalid='ignore'):
             growth = np.where(
                 prev_value != 0,
-                (df_result[column] - prev_value) / prev_value * 100,
+                growth_abs / prev_value * 100,
                 np.nan  # 이전 값이 0이면 성장률 정의 불가
             )
 
@@ -292,14 +324,14 @@ class SalesAnalyzer:
         logger.info(f"상품 순위 계산: TOP {top_n}, 기준={metric}")
 
         # 상품별 집계 (Critical Fix #6: self.sales_column 사용)
-        product_agg = self.df.groupby(self.product_column).agg({
+        product_agg = self.df.groupby(self.product_column, observed=True).agg({
             self.sales_column: 'sum',
             self.quantity_column: 'sum',
             self.price_column: 'mean'
         }).reset_index()
 
         # 거래 건수
-        transaction_counts = self.df.groupby(self.product_column).size().reset_index(name='transactions')
+        transaction_counts = self.df.groupby(self.product_column, observed=True).size().reset_index(name='transactions')
         product_agg = product_agg.merge(transaction_counts, on=self.product_column, how='left')
 
         # 컬럼명 정리
@@ -337,7 +369,7 @@ class SalesAnalyzer:
         logger.info(f"파레토 분석 시작: {metric}")
 
         # 상품별 집계 (Critical Fix #6: sales_column 사용)
-        product_agg = self.df.groupby(self.product_column).agg({
+        product_agg = self.df.groupby(self.product_column, observed=True).agg({
             self.sales_column: 'sum',
             self.quantity_column: 'sum'
         }).reset_index()
@@ -7,7 +7,6 @@ import pandas as pd
 import numpy as np
 import re
 from typing import Dict, List, Tuple
-from collections import Counter
 
 # NLP 라이브러리
 try:
@@ -343,15 +342,16 @@ class TextAnalyzer:
         if self.processed_texts is None:
             self.preprocess_text()
         
-        # 모든 단어 추출
-        all_words = []
-        for text in self.processed_texts:
-            all_words.extend(text.split())
+        # 단어 분리 + 빈도수 계산 (벡터화)
+        # 동률은 Counter.most_common과 같이 처음 등장한 순서 유지
+        word_counts = (pd.Series(self.processed_texts, dtype=object)
+                       .str.split()
+                       .explode()
+                       .value_counts(sort=False)
+                       .sort_values(ascending=False, kind='stable')
+                       .head(top_n))
         
-        # 빈도수 계산
-        word_counts = Counter(all_words)
-        
-        return word_counts.most_common(top_n)
+        return [(word, int(count)) for word, count in word_counts.items()]
     
     def get_sentiment_summary(self) -> Dict:
         """감성 분석 요약 통계"""
@@ -962,7 +962,7 @@ class Visualizer:
 
         # 상위 N개만 추출
         actual_top_n = min(top_n, len(df))
-        df_top = df.head(actual_top_n).copy()
+        df_top = df.head(actual_top_n)
 
         if len(df_top) == 0:
             raise ValueError("표시할 데이터가 없습니다.")
@@ -972,7 +972,9 @@ class Visualizer:
             title = f'상품별 매출 순위 TOP {actual_top_n}'
 
         # 역순으로 정렬 (가로 막대 차트는 아래에서 위로 표시)
-        df_top = df_top.iloc[::-1]
+        # 필요한 두 컬럼만 NumPy 배열로 한 번 추출 (Plotly는 배열을 변환 없이 사용)
+        names = df_top[product_column].to_numpy()[::-1]
+        sales = df_top[sales_column].to_numpy()[::-1]
 
         # ========== Critical Fix #3: 색상 범위 체크 + 안전한 색상 생성 ==========
         # HSL 색상 공간 사용 (더 안전하고 접근성 좋음)
@@ -987,11 +989,11 @@ class Visualizer:
         colors = [generate_safe_color(i, len(df_top)) for i in range(len(df_top))]
 
         # ========== Critical Fix #9: 벡터화로 성능 개선 ==========
-        text_labels = [f'{x:,.0f}{currency}' for x in df_top[sales_column]]
+        text_labels = [f'{x:,.0f}{currency}' for x in sales]
 
         fig = go.Figure(go.Bar(
-            x=df_top[sales_column],
-            y=df_top[product_column],
+            x=sales,
+            y=names,
             orientation='h',
             marker=dict(
                 color=colors,
@@ -1007,7 +1009,7 @@ class Visualizer:
         final_height = max(400, min(calculated_height, max_height))
 
         # ========== Critical Fix #11: 동적 마진 계산 ==========
-        max_product_name_length = df_top[product_column].astype(str).str.len().max()
+        max_product_name_length = max(len(str(name)) for name in names)
         left_margin = min(150 + max_product_name_length * 3, 300)  # 최대 300px
 
         fig.update_layout(
@@ -1067,7 +1069,10 @@ class Visualizer:
 
         # 상위 N개만 표시
         actual_top_n = min(top_n, len(pareto_df))
-        df_plot = pareto_df.head(actual_top_n).copy()
+        df_plot = pareto_df.head(actual_top_n)
+        # 필요한 컬럼만 NumPy 배열로 한 번 추출 (Plotly는 배열을 변환 없이 사용)
+        names = df_plot[product_column].to_numpy()
+        cumulative_pct = df_plot[cumulative_pct_column].to_numpy()
 
         # 듀얼 축 차트 생성
         fig = make_subplots(specs=[[{"secondary_y": True}]])
@@ -1075,8 +1080,8 @@ class Visualizer:
         # 1차 축: 매출 막대 차트 (Critical Fix #7: 통화 파라미터화)
         fig.add_trace(
             go.Bar(
-                x=df_plot[product_column],
-                y=df_plot[sales_column],
+                x=names,
+                y=df_plot[sales_column].to_numpy(),
                 name='매출',
                 marker_color='steelblue',
                 hovertemplate=f'<b>%{{x}}</b><br>매출: %{{y:,.0f}}{currency}<extra></extra>'
@@ -1087,8 +1092,8 @@ class Visualizer:
         # 2차 축: 누적 비율 선 차트 (Critical Fix #12: 색맹 친화적 색상)
         fig.add_trace(
             go.Scatter(
-                x=df_plot[product_column],
-                y=df_plot[cumulative_pct_column],
+                x=names,
+                y=cumulative_pct,
                 name='누적 비율',
                 line=dict(color='#d62728', width=3),  # 빨강 대신 주황-빨강
                 mode='lines+markers',
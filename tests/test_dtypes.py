@@ -0,0 +1,94 @@
+"""
+dtype 다운캐스팅 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from utils.dtypes import downcast, downcast_numeric, upcast_numeric
+
+
+class TestDowncast:
+    """utils.dtypes.downcast 테스트"""
+
+    def test_integers_use_int32_floor(self):
+        """작은 정수도 int8/int16이 아닌 int32로 변환 (곱셈 오버플로 방지)"""
+        df = downcast(pd.DataFrame({'quantity': [1, 2, 3], 'price': [15000, 20000, 30000]}))
+
+        assert df['quantity'].dtype == np.int32
+        assert df['price'].dtype == np.int32
+        assert (df['quantity'] * df['price']).tolist() == [15000, 40000, 90000]
+
+    def test_large_integers_kept(self):
+        """int32 범위를 넘는 정수는 그대로 유지"""
+        df = downcast(pd.DataFrame({'id': [1, 2**40]}))
+
+        assert df['id'].dtype == np.int64
+
+    def test_float_downcast_only_when_lossless(self):
+        """값 손실이 없을 때만 float32"""
+        df = downcast(pd.DataFrame({'exact': [0.5, 1.25], 'precise': [0.1, 1234567.89]}))
+
+        assert df['exact'].dtype == np.float32
+        assert df['precise'].dtype == np.float64
+
+    def test_float_downcast_requires_exact_round_trip(self):
+        """허용 오차 안이라도 float32 왕복 값이 달라지면 float64 유지"""
+        df = downcast_numeric(pd.DataFrame({
+            'price': [2.55, 3.39, 1.25],
+            'exact': [2.5, np.nan, 1.25],
+        }))
+
+        assert df['price'].dtype == np.float64
+        assert df['price'].tolist() == [2.55, 3.39, 1.25]
+        assert df['exact'].dtype == np.float32
+
+    def test_low_cardinality_strings_to_category(self):
+        """고유값 비율이 낮은 문자열만 category"""
+        df = downcast(pd.DataFrame({
+            'product': ['A', 'B', 'A', 'B', 'A', 'B'],
+            'review': ['r1', 'r2', 'r3', 'r4', 'r5', 'r6'],
+        }))
+
+        assert isinstance(df['product'].dtype, pd.CategoricalDtype)
+        assert df['review'].dtype == object
+
+    def test_date_strings_not_categorized(self):
+        """날짜 문자열은 pd.to_datetime 변환을 위해 object 유지"""
+        df = downcast(pd.DataFrame({'date': ['2024-01-01', '2024-01-01', '2024-01-02', '2024-01-02']}))
+
+        assert df['date'].dtype == object
+        assert pd.api.types.is_datetime64_any_dtype(pd.to_datetime(df['date']))
+
+    def test_numeric_only_keeps_strings(self):
+        """downcast_numeric은 문자열 컬럼을 그대로 유지"""
+        df = downcast_numeric(pd.DataFrame({
+            'Recency': [10, 20, 30],
+            'cluster_name': ['VIP', 'VIP', '일반'],
+        }))
+
+        assert df['Recency'].dtype == np.int32
+        assert df['cluster_name'].dtype == object
+
+
+class TestUpcastNumeric:
+    """utils.dtypes.upcast_numeric 테스트"""
+
+    def test_int32_product_does_not_overflow(self):
+        """int32로 다운캐스팅된 수량 × 단가가 2**31을 넘어도 정확히 계산"""
+        df = downcast(pd.DataFrame({'quantity': [1000, 1], 'price': [3_000_000, 100]}))
+        assert df['quantity'].dtype == np.int32
+
+        revenue = upcast_numeric(df['quantity']) * upcast_numeric(df['price'])
+
+        assert revenue.dtype == np.int64
+        assert revenue.tolist() == [3_000_000_000, 100]
+
+    def test_float32_and_other_dtypes(self):
+        """float32는 float64로, 문자열 등은 그대로"""
+        assert upcast_numeric(pd.Series([1.5], dtype=np.float32)).dtype == np.float64
+        strings = pd.Series(['a'])
+        assert upcast_numeric(strings) is strings
@@ -0,0 +1,128 @@
+"""
+GPTAnalyzer 테스트 (API 호출 없이 가짜 클라이언트 사용)
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip('openai')
+from modules.gpt_analyzer import GPTAnalyzer
+from utils.gpt_cache import SentimentCache
+
+
+class FakeCompletions:
+    """배치 리뷰를 그대로 reason에 담아 돌려주는 가짜 chat.completions"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, messages, **kwargs):
+        self.calls += 1
+        prompt = messages[-1]['content']
+        batch = json.loads(prompt.split('리뷰들:\n', 1)[1].split('\n\n', 1)[0])
+        time.sleep(0.01)
+        content = json.dumps({'results': [
+            {'sentiment': 'positive', 'confidence': 0.9, 'reason': review} for review in batch
+        ]})
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=SimpleNamespace(total_tokens=10, prompt_tokens=6, completion_tokens=4),
+        )
+
+
+@pytest.fixture
+def analyzer():
+    gpt = GPTAnalyzer(api_key='test-key', use_cache=False)
+    gpt.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+    return gpt
+
+
+class TestAnalyzeSentimentBatch:
+    """GPTAnalyzer.analyze_sentiment_batch 테스트"""
+
+    def test_concurrent_batches_keep_order(self, analyzer):
+        """동시 요청 시에도 결과 순서가 입력 순서와 동일"""
+        reviews = [f'review {i}' for i in range(35)]
+
+        results = analyzer.analyze_sentiment_batch(reviews, max_reviews=len(reviews), max_workers=4)
+
+        assert [r['reason'] for r in results] == reviews
+        assert analyzer.total_tokens == 40  # 4개 배치 × 10토큰
+
+    def test_cached_reviews_skip_api(self, analyzer, tmp_path):
+        """캐시에 있는 리뷰는 API 호출 없이 결과 재사용"""
+        analyzer.cache = SentimentCache(str(tmp_path / 'cache.db'))
+        first = [f'review {i}' for i in range(10)]
+        analyzer.analyze_sentiment_batch(first, max_reviews=len(first))
+        calls = analyzer.client.chat.completions.calls
+
+        reviews = first + ['new review']
+        results = analyzer.analyze_sentiment_batch(reviews, max_reviews=len(reviews))
+
+        assert [r['reason'] for r in results] == reviews
+        assert analyzer.client.chat.completions.calls == calls + 1  # 새 리뷰 1개 배치만 요청
+
+
+    def test_cache_opened_only_during_batch(self, monkeypatch, tmp_path):
+        """캐시 연결은 생성 시가 아니라 감성 분석 호출 동안만 열고 닫음"""
+        opened = []
+
+        class RecordingCache(SentimentCache):
+            def __init__(self):
+                super().__init__(str(tmp_path / 'cache.db'))
+                self.closed = False
+                opened.append(self)
+
+            def close(self):
+                self.closed = True
+                super().close()
+
+        monkeypatch.setattr('modules.gpt_analyzer.SentimentCache', RecordingCache)
+        gpt = GPTAnalyzer(api_key='test-key')
+        gpt.client = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions()))
+        assert opened == []
+
+        reviews = [f'review {i}' for i in range(5)]
+        gpt.analyze_sentiment_batch(reviews, max_reviews=len(reviews))
+        gpt.analyze_sentiment_batch(reviews, max_reviews=len(reviews))
+
+        assert len(opened) == 2
+        assert all(cache.closed for cache in opened)
+        assert gpt.client.chat.completions.calls == 1  # 두 번째 호출은 디스크 캐시 적중
+
+
+class TestSelectReanalysisPositions:
+    """GPT 재분석 대상 선정"""
+
+    def test_nan_sentiment_not_selected(self):
+        sentiments = ['negative', None, 'positive', 'neutral', float('nan')] * 6
+        positions = GPTAnalyzer.select_reanalysis_positions(sentiments, max_reviews=500)
+
+        selected = {sentiments[i] for i in positions}
+        assert selected == {'negative', 'neutral'}
+        assert len(positions) == 12
+
+    def test_caps_at_max_reviews(self):
+        import numpy as np
+
+        sentiments = ['negative'] * 50 + ['positive'] * 50
+        positions = GPTAnalyzer.select_reanalysis_positions(
+            sentiments, max_reviews=20, rng=np.random.default_rng(0)
+        )
+
+        assert len(positions) == 20
+        assert len(set(positions)) == 20
+        assert all(p < 50 for p in positions)
+
+    def test_falls_back_to_all_rows_when_few_targets(self):
+        sentiments = ['positive'] * 15 + ['negative']
+        positions = GPTAnalyzer.select_reanalysis_positions(sentiments, max_reviews=500)
+
+        assert list(positions) == list(range(16))
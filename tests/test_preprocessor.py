@@ -0,0 +1,38 @@
+"""
+DataPreprocessor 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from modules.preprocessor import DataPreprocessor
+
+
+class TestCleanForAnalysis:
+    """DataPreprocessor.clean_for_analysis 테스트"""
+
+    def test_matches_method_chain(self):
+        """개별 메서드 체이닝과 결과 및 로그가 동일"""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'Customer ID': rng.integers(0, 5, 200).astype(float),
+            'InvoiceDate': rng.choice(['2024-01-01', '2024-01-02'], 200),
+            'Quantity': rng.integers(0, 3, 200),
+        })
+        df.loc[rng.choice(200, 30), 'Customer ID'] = np.nan
+
+        expected_df, expected_logs = (DataPreprocessor(df)
+                                      .normalize_column_names()
+                                      .handle_missing_values(strategy='drop')
+                                      .remove_duplicates()
+                                      .convert_date_columns(['invoicedate'])
+                                      .get_processed_data())
+        result_df, result_logs = (DataPreprocessor(df)
+                                  .clean_for_analysis(['invoicedate'])
+                                  .get_processed_data())
+
+        pd.testing.assert_frame_equal(result_df, expected_df)
+        assert result_logs == expected_logs
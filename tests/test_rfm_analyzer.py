@@ -0,0 +1,55 @@
+"""
+RFMAnalyzer 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from modules.rfm_analyzer import RFMAnalyzer
+from utils.dtypes import downcast, downcast_numeric
+
+
+class TestTotalAmount:
+    """RFMAnalyzer 금액 컬럼 생성 테스트"""
+
+    def test_int32_amount_does_not_overflow(self):
+        """int32로 다운캐스팅된 수량 × 단가가 2**31을 넘어도 Monetary가 정확"""
+        df = downcast(pd.DataFrame({
+            'CustomerID': [1, 1, 2],
+            'InvoiceDate': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-03']),
+            'Quantity': [1000, 1, 2],
+            'UnitPrice': [3_000_000, 100, 100],
+        }))
+        assert df['Quantity'].dtype == np.int32
+
+        rfm = RFMAnalyzer(df).calculate_rfm()
+
+        monetary = rfm.set_index('CustomerID')['Monetary']
+        assert monetary.loc[1] == 3_000_000_100
+        assert monetary.loc[2] == 200
+
+
+class TestResultDowncast:
+    """저장용 결과 DataFrame 다운캐스팅 테스트"""
+
+    def test_clustered_monetary_unchanged(self):
+        """float32 왕복 시 달라지는 금액은 다운캐스팅 후에도 그대로"""
+        rng = np.random.default_rng(0)
+        n = 60
+        df = pd.DataFrame({
+            'CustomerID': rng.integers(1, 21, n),
+            'InvoiceDate': pd.Timestamp('2024-01-01') + pd.to_timedelta(rng.integers(0, 90, n), unit='D'),
+            'Quantity': rng.integers(1, 10, n),
+            'UnitPrice': rng.choice([2.55, 3.39, 0.85, 1.65], n),
+        })
+        analyzer = RFMAnalyzer(df)
+        analyzer.calculate_rfm()
+        clustered = analyzer.perform_clustering(k=3)
+
+        expected = clustered.copy()
+        downcast_numeric(clustered)
+
+        pd.testing.assert_frame_equal(clustered, expected, check_dtype=False, check_exact=True)
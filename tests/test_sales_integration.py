@@ -235,6 +235,21 @@ class TestSalesAnalysisWorkflow:
         np.testing.assert_almost_equal(weekly_total, total_sales, decimal=2)
         np.testing.assert_almost_equal(monthly_total, total_sales, decimal=2)
 
+    def test_aggregate_by_periods_matches_individual(self, sample_sales_data):
+        """Weekly/monthly derived from daily aggregate match direct aggregation"""
+        analyzer = SalesAnalyzer(
+            sample_sales_data,
+            date_column='date',
+            product_column='product',
+            quantity_column='quantity',
+            price_column='price'
+        )
+
+        aggregates = analyzer.aggregate_by_periods(['D', 'W', 'M'])
+
+        for period in ['D', 'W', 'M']:
+            pd.testing.assert_frame_equal(aggregates[period], analyzer.aggregate_by_period(period))
+
     def test_workflow_with_summary_statistics(self, sample_sales_data):
         """Test workflow including summary statistics"""
         analyzer = SalesAnalyzer(
@@ -367,6 +382,41 @@ class TestSalesAnalysisEdgeCasesIntegration:
         # No infinite values
         assert not np.isinf(daily_growth['sales_growth'].dropna()).any()
 
+    def test_downcast_int32_sales_do_not_overflow(self):
+        """Test quantity × price above 2**31 on int32-downcast columns"""
+        from utils.dtypes import downcast
+
+        df = downcast(pd.DataFrame([
+            {'date': '2024-01-01', 'product': 'A', 'quantity': 1000, 'price': 3_000_000},
+            {'date': '2024-01-02', 'product': 'B', 'quantity': 2, 'price': 100}
+        ]))
+        assert df['quantity'].dtype == np.int32
+
+        analyzer = SalesAnalyzer(df, date_column='date', product_column='product',
+                                quantity_column='quantity', price_column='price')
+
+        assert analyzer.df['sales'].tolist() == [3_000_000_000, 200]
+
+
+    def test_downcast_results_keep_exact_values(self):
+        """Test that downcasting stored results never changes sales values"""
+        from utils.dtypes import downcast_numeric
+
+        df = pd.DataFrame({
+            'date': pd.date_range('2024-01-01', periods=6, freq='D'),
+            'product': ['A', 'B', 'A', 'C', 'B', 'A'],
+            'quantity': [3, 1, 2, 5, 4, 1],
+            'price': [2.55, 3.39, 2.55, 1.25, 3.39, 2.55]
+        })
+        analyzer = SalesAnalyzer(df, date_column='date', product_column='product',
+                                quantity_column='quantity', price_column='price')
+
+        for result_df in (analyzer.aggregate_by_period('D'), analyzer.get_top_products(),
+                          analyzer.analyze_pareto()[0]):
+            expected = result_df.copy()
+            downcast_numeric(result_df)
+            pd.testing.assert_frame_equal(result_df, expected, check_dtype=False, check_exact=True)
+
 
 class TestSalesAnalysisRealWorldScenarios:
     """Real-world scenario tests"""
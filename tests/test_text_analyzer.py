@@ -0,0 +1,36 @@
+"""
+TextAnalyzer 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from collections import Counter
+
+import pandas as pd
+from modules.text_analyzer import TextAnalyzer
+
+
+class TestWordFrequency:
+    """TextAnalyzer.get_word_frequency 테스트"""
+
+    def _analyzer(self, processed_texts):
+        analyzer = TextAnalyzer(pd.DataFrame({'review': processed_texts}))
+        analyzer.processed_texts = processed_texts
+        return analyzer
+
+    def test_matches_counter(self):
+        """Counter.most_common과 결과 및 동률 순서가 동일"""
+        texts = ['배송 빠름 만족', '', '품질 만족 배송', '가격 품질', '만족', '포장 가격']
+
+        all_words = []
+        for text in texts:
+            all_words.extend(text.split())
+        expected = Counter(all_words).most_common(4)
+
+        assert self._analyzer(texts).get_word_frequency(top_n=4) == expected
+
+    def test_empty_texts(self):
+        """단어가 없으면 빈 리스트"""
+        assert self._analyzer(['', '']).get_word_frequency() == []
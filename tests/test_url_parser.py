@@ -0,0 +1,31 @@
+"""
+url_parser 테스트
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.url_parser import extract_place_id
+
+
+class TestExtractPlaceId:
+    """플레이스 ID 추출"""
+
+    def test_mobile_place_url(self):
+        url = "https://m.place.naver.com/restaurant/1234567/review/visitor"
+        assert extract_place_id(url) == "1234567"
+
+    def test_pattern_order_wins_over_position(self):
+        # ?id=의 10자리 숫자가 /place/<id>보다 앞에 있어도 /place/ 패턴이 우선
+        url = "https://example.com/share?id=9876543210&next=/place/1234567"
+        assert extract_place_id(url) == "1234567"
+
+    def test_long_numeric_fallback(self):
+        assert extract_place_id("https://naver.me/x?id=1234567890") == "1234567890"
+
+    def test_plain_id(self):
+        assert extract_place_id("12345") == "12345"
+
+    def test_no_id(self):
+        assert extract_place_id("https://naver.com/") is None
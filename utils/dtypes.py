@@ -0,0 +1,112 @@
+"""
+DataFrame 메모리 최적화 모듈
+로드 직후 dtype 다운캐스팅으로 세션에 저장되는 DataFrame 크기 축소
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+
+# 고유값 비율이 이 값 미만인 문자열 컬럼은 category로 변환
+CATEGORY_RATIO_THRESHOLD = 0.5
+
+
+def downcast(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    dtype 다운캐스팅 (원본을 직접 수정하고 반환)
+
+    - 정수: int32 범위에 들어가면 int32 (수량 × 단가 곱셈 오버플로 방지를 위해 int8/int16은 사용하지 않음)
+    - 실수: 값 손실이 없을 때만 float32
+    - 문자열: 고유값 비율이 낮으면 category
+
+    Args:
+        df: 데이터프레임
+
+    Returns:
+        다운캐스팅된 데이터프레임
+    """
+    downcast_numeric(df)
+
+    n_rows = max(len(df), 1)
+    for col in df.select_dtypes(include='object').columns:
+        # 날짜 문자열은 category로 바꾸면 pd.to_datetime 결과도 category가 되므로 제외
+        if _looks_like_date(df[col]):
+            continue
+        if df[col].nunique(dropna=True) / n_rows < CATEGORY_RATIO_THRESHOLD:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    숫자 컬럼만 다운캐스팅 (원본을 직접 수정하고 반환)
+
+    분석 결과 DataFrame처럼 문자열 컬럼을 필터/표시에 그대로 쓰는 경우에 사용.
+    정수는 int32 범위일 때만 int32, 실수는 값 손실이 없을 때만 float32.
+
+    Args:
+        df: 데이터프레임
+
+    Returns:
+        다운캐스팅된 데이터프레임
+    """
+    int32 = np.iinfo(np.int32)
+
+    for col in df.select_dtypes(include='integer').columns:
+        if df[col].empty:
+            continue
+        if int32.min <= df[col].min() and df[col].max() <= int32.max:
+            df[col] = df[col].astype(np.int32)
+
+    for col in df.select_dtypes(include='float').columns:
+        # pd.to_numeric(downcast='float')는 허용 오차 안이면 변환하므로 (2.55 → 2.5499999523)
+        # float32로 바꿨다가 되돌린 값이 원래 값과 정확히 같을 때만 변환
+        values = df[col].to_numpy()
+        if values.dtype != np.float64:
+            continue
+        as_float32 = values.astype(np.float32)
+        if np.array_equal(values, as_float32.astype(np.float64), equal_nan=True):
+            df[col] = as_float32
+
+    return df
+
+
+def upcast_numeric(series: pd.Series) -> pd.Series:
+    """
+    산술 연산 전 숫자 컬럼을 64비트로 되돌림
+
+    다운캐스팅된 int32 컬럼끼리 곱하면(수량 × 단가) 2**31을 넘는 순간
+    오류 없이 오버플로되므로, 곱셈 전에 int64/float64로 변환한다.
+
+    Args:
+        series: 숫자 Series
+
+    Returns:
+        int64/float64 Series (그 외 dtype은 그대로)
+    """
+    dtype = series.dtype
+    if not isinstance(dtype, np.dtype) or dtype.itemsize >= 8:
+        return series
+    if dtype.kind in 'iu':
+        return series.astype(np.int64)
+    if dtype.kind == 'f':
+        return series.astype(np.float64)
+    return series
+
+
+def _looks_like_date(series: pd.Series) -> bool:
+    """샘플 100개로 날짜 컬럼 여부 판단 (DataLoader 품질 리포트와 동일한 방식)"""
+    sample = series.dropna().head(100)
+    if sample.empty:
+        return False
+    try:
+        with warnings.catch_warnings():
+            # 형식 추론 실패 경고는 판단에 영향이 없으므로 무시
+            warnings.simplefilter('ignore', UserWarning)
+            pd.to_datetime(sample)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
@@ -0,0 +1,78 @@
+"""
+GPT Sentiment Cache Module
+리뷰 텍스트 해시 기준 GPT 감성 분석 결과 디스크 캐시
+
+같은 리뷰를 다시 분석할 때 API 호출 없이 저장된 결과를 재사용
+"""
+
+import hashlib
+import json
+import sqlite3
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class SentimentCache:
+    """SQLite 기반 리뷰별 감성 분석 결과 캐시"""
+
+    def __init__(self, db_path: str = 'data/gpt_sentiment_cache.db'):
+        """
+        Args:
+            db_path: 캐시 SQLite 파일 경로
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("""
+        CREATE TABLE IF NOT EXISTS sentiment_cache (
+            key TEXT PRIMARY KEY,  -- sha256(모델 + 리뷰 텍스트)
+            result TEXT NOT NULL   -- 결과 JSON
+        )
+        """)
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(model: str, text: str) -> str:
+        """캐시 키 생성 (모델이 다르면 결과도 다르므로 키에 포함)"""
+        return hashlib.sha256(f"{model}\n{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """
+        여러 키의 캐시 결과 조회
+
+        Args:
+            keys: 캐시 키 리스트
+
+        Returns:
+            {키: 결과} (캐시에 있는 키만 포함)
+        """
+        found = {}
+        # SQLite 바인딩 변수 개수 제한을 피하기 위해 나눠서 조회
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i+500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, result FROM sentiment_cache WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            found.update({key: json.loads(result) for key, result in rows})
+        return found
+
+    def set_many(self, items: Iterable[Tuple[str, Dict]]):
+        """
+        여러 결과 저장
+
+        Args:
+            items: (키, 결과) 쌍
+        """
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO sentiment_cache (key, result) VALUES (?, ?)",
+            [(key, json.dumps(result, ensure_ascii=False)) for key, result in items]
+        )
+        self.conn.commit()
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
@@ -18,6 +18,7 @@ class SessionManager:
     KEY_DATA_TYPE = 'data_type'
     KEY_DATA_SOURCE = 'data_source'
     KEY_FILE_NAME = 'file_name'
+    KEY_UPLOAD_FILE_ID = 'upload_file_id'
     KEY_ANALYSIS_TYPE = 'analysis_type'
     KEY_COLUMN_MAPPING = 'column_mapping'
     KEY_ANALYSIS_COMPLETE = 'analysis_complete'
@@ -101,10 +102,13 @@ class SessionManager:
             source: 'upload' | 'crawl_movie' | 'crawl_place' | 'sample'
             file_name: 파일명 (선택)
         """
-        st.session_state[SessionManager.KEY_DATA] = data
-        st.session_state[SessionManager.KEY_DATA_TYPE] = data_type
-        st.session_state[SessionManager.KEY_DATA_SOURCE] = source
-        st.session_state[SessionManager.KEY_FILE_NAME] = file_name
+        # 세션 상태는 동기적으로 갱신되므로 호출 직후 st.rerun()해도 안전 (대기 불필요)
+        st.session_state.update({
+            SessionManager.KEY_DATA: data,
+            SessionManager.KEY_DATA_TYPE: data_type,
+            SessionManager.KEY_DATA_SOURCE: source,
+            SessionManager.KEY_FILE_NAME: file_name,
+        })
 
     @staticmethod
     def get_data() -> Optional[pd.DataFrame]:
@@ -0,0 +1,34 @@
+"""
+크롤링 URL 파싱 모듈
+네이버 플레이스 URL에서 ID 추출 (정규식은 모듈 로드 시 한 번만 컴파일)
+"""
+
+import re
+from typing import Optional
+
+
+# 우선순위 순서대로 탐색 (하나의 alternation으로 합치면 URL에서 가장 왼쪽 매치가 이기므로 분리 유지)
+_PLACE_ID_PATTERNS = (
+    re.compile(r'place\.naver\.com/[^/]+/(\d+)'),
+    re.compile(r'pcmap\.place\.naver\.com/[^/]+/(\d+)'),
+    re.compile(r'map\.naver\.com/[^/]+/place/(\d+)'),
+    re.compile(r'/place/(\d+)'),
+    re.compile(r'(\d{10,})'),
+)
+
+
+def extract_place_id(url: str) -> Optional[str]:
+    """
+    네이버 플레이스 URL 또는 ID 문자열에서 플레이스 ID 추출
+
+    Args:
+        url: 플레이스 URL 또는 숫자 ID
+
+    Returns:
+        플레이스 ID (찾지 못하면 None)
+    """
+    for pattern in _PLACE_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return url if url.isdigit() else None